@@ -1,18 +1,35 @@
+import argparse
 import asyncio
 import os
 import logging
+import functools
+import itertools
+import json
+import random
+import re
+import sqlite3
+import threading
+import time
+import aiohttp
 import instaloader
 import requests
-from typing import List, Optional
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
 import hashlib
 
+from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
 from webdriver_manager.chrome import ChromeDriverManager
 
 
@@ -23,17 +40,195 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class VideoDownloader:
-    def __init__(self, social_media: str, download_path: str = 'downloads'):
+# SocialVerse authentication token, prefer setting FLIC_TOKEN in the environment
+FLIC_TOKEN = os.environ.get("FLIC_TOKEN", "flic_16a53d750040604a11c71ae66b138ee44b85929c51fa21abe26db4167627552b")
+
+# Resolved ChromeDriver path is cached on disk and refreshed once a day
+CHROMEDRIVER_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'video-bot', 'chromedriver.json')
+CHROMEDRIVER_CACHE_TTL = 24 * 60 * 60
+
+_chromedriver_path: Optional[str] = None
+_chromedriver_lock = threading.Lock()
+
+def resolve_chromedriver_path(
+    cache_file: str = CHROMEDRIVER_CACHE_FILE,
+    max_age: int = CHROMEDRIVER_CACHE_TTL
+) -> str:
+    """
+    Resolve the ChromeDriver binary once per process, reusing a cached path for up to a day
+    
+    Set the CHROMEDRIVER_PATH environment variable to pin a driver binary and
+    skip resolution entirely (offline mode). If resolution fails, a stale cached
+    path is used when the binary still exists.
+    
+    :param cache_file: JSON file holding the last resolved path
+    :param max_age: Seconds before the cached path is resolved again
+    :return: Path to the ChromeDriver binary
+    """
+    global _chromedriver_path
+    
+    with _chromedriver_lock:
+        if _chromedriver_path:
+            return _chromedriver_path
+        
+        # Offline mode: pinned driver path
+        pinned_path = os.environ.get('CHROMEDRIVER_PATH')
+        if pinned_path:
+            if not os.path.isfile(pinned_path):
+                raise FileNotFoundError(f"CHROMEDRIVER_PATH does not exist: {pinned_path}")
+            _chromedriver_path = pinned_path
+            return _chromedriver_path
+        
+        # Reuse the on-disk cache while it is fresh
+        cached = {}
+        try:
+            with open(cache_file) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            pass
+        
+        cached_path = cached.get('path')
+        cached_valid = bool(cached_path) and os.path.isfile(cached_path)
+        if cached_valid and time.time() - cached.get('resolved_at', 0) < max_age:
+            _chromedriver_path = cached_path
+            return _chromedriver_path
+        
+        # Use WebDriverManager to resolve (and download if needed) the driver
+        try:
+            driver_path = ChromeDriverManager().install()
+        except Exception as resolve_error:
+            if not cached_valid:
+                raise
+            logger.warning(f"ChromeDriver resolution failed, using cached driver: {resolve_error}")
+            _chromedriver_path = cached_path
+            return _chromedriver_path
+        
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, 'w') as f:
+                json.dump({'path': driver_path, 'resolved_at': time.time()}, f)
+        except OSError as cache_error:
+            logger.warning(f"Could not write ChromeDriver cache: {cache_error}")
+        
+        _chromedriver_path = driver_path
+        return _chromedriver_path
+
+class DownloadEngine:
+    def __init__(self, max_workers: int = 5, per_host_limit: int = 3):
         """
-        Initialize video downloader with Chrome WebDriver and Instaloader
+        Run blocking download calls concurrently on a worker thread pool
         
-        :param social_media: Social media platform
-        :param download_path: Directory to save downloaded videos
+        :param max_workers: Number of downloads allowed to run at the same time
+        :param per_host_limit: Maximum concurrent downloads against a single host
         """
-        self.download_path = download_path
-        os.makedirs(self.download_path, exist_ok=True)
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='download'
+        )
+        self._worker_slots: Optional[asyncio.Semaphore] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.closed = False
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """
+        Get the concurrency cap shared by all downloads from the URL's host
+        
+        :param url: URL being downloaded
+        :return: Semaphore for the host
+        """
+        host = urlparse(url).netloc.lower()
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_slots[host]
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """
+        Hold a worker and a host slot for the duration of an ``async with`` block
+        
+        :param url: URL being downloaded, used for the per-host cap
+        """
+        if self._worker_slots is None:
+            self._worker_slots = asyncio.Semaphore(self.max_workers)
+        
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            async with self._worker_slots, self._host_semaphore(url):
+                # Do not start new work once the engine was shut down
+                if self.closed:
+                    raise asyncio.CancelledError()
+                yield
+        finally:
+            self._tasks.discard(task)
+
+    async def run(self, url: str, func: Callable[..., Any], *args) -> Any:
+        """
+        Run a blocking download function once a worker and a host slot are free
+        
+        :param url: URL being downloaded, used for the per-host cap
+        :param func: Blocking function performing the download
+        :return: Result of the function
+        """
+        async with self.slot(url):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(func, *args)
+            )
+
+    def cancel(self):
+        """
+        Cancel every queued or running download
+        
+        Downloads already running in a worker thread finish in the background,
+        but their results are discarded.
+        """
+        for task in list(self._tasks):
+            task.cancel()
+
+    def shutdown(self):
+        """
+        Cancel outstanding downloads and stop the worker threads
+        """
+        self.closed = True
+        self.cancel()
+        self._executor.shutdown(wait=False)
+
+class BrowserPool:
+    def __init__(
+        self,
+        size: int = 2,
+        max_uses: int = 50,
+        max_memory_mb: int = 1024,
+        driver_path: Optional[str] = None
+    ):
+        """
+        Pool of warm headless Chrome sessions shared by keyword searches
+        
+        :param size: Maximum number of browsers kept alive at once
+        :param max_uses: Recycle a browser after this many searches
+        :param max_memory_mb: Recycle a browser once its process tree uses more memory than this
+        :param driver_path: ChromeDriver binary, resolved and cached automatically if omitted
+        """
+        self.size = size
+        self.driver_path = driver_path
+        self.max_uses = max_uses
+        self.max_memory_mb = max_memory_mb
+        self._idle: Optional[asyncio.Queue] = None
+        self._all: Set[webdriver.Chrome] = set()
+        self._uses: Dict[webdriver.Chrome, int] = {}
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _create_driver(self) -> webdriver.Chrome:
+        """
+        Start a new headless Chrome session (blocking)
         
+        :return: Chrome WebDriver
+        """
         # Chrome WebDriver setup with advanced options
         chrome_options = Options()
         chrome_options.add_argument("--headless")
@@ -43,125 +238,2068 @@ class VideoDownloader:
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         
-        # Use WebDriverManager to automatically manage ChromeDriver
-        service = Service(ChromeDriverManager().install())
-        
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        # Initialize Instaloader
-        self.L = instaloader.Instaloader(
-             download_videos=True,
-            download_video_thumbnails=False,
-            download_geotags=False,
-            download_comments=False,
-            download_pictures=False,
-            save_metadata=False,
-            compress_json=False,
-            dirname_pattern=download_path
-        )
-        self.L.quiet = True 
+        # Driver binary is resolved once per process and cached on disk
+        service = Service(self.driver_path or resolve_chromedriver_path())
+        
+        return webdriver.Chrome(service=service, options=chrome_options)
 
-    async def find_video_links(self, keyword: str, max_videos: int = 10) -> List[str]:
+    @staticmethod
+    def _is_healthy(driver: webdriver.Chrome) -> bool:
         """
-        Find Instagram video links using Google search
+        Check that the browser session still responds (blocking)
         
-        :param keyword: Search keyword
-        :param max_videos: Maximum number of videos to find
-        :return: List of video links
+        :param driver: Chrome WebDriver
+        :return: True if the session is usable
+        """
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def _process_tree(pid: int) -> List[int]:
+        """
+        List a process and all of its descendants from /proc (blocking)
+        
+        :param pid: Root process ID
+        :return: Process IDs, the root first
+        """
+        children: Dict[int, List[int]] = {}
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    # The command name may contain spaces, the parent PID follows it
+                    ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(ppid, []).append(int(entry))
+        
+        tree = [pid]
+        for parent in tree:
+            tree.extend(children.get(parent, []))
+        return tree
+
+    @staticmethod
+    def _process_memory_kb(pid: int) -> int:
+        """
+        Read the memory used by one process (blocking)
+        
+        Uses the proportional set size, so pages shared between Chrome's
+        processes are not counted once per process, and falls back to the
+        resident set size on kernels without smaps_rollup.
+        
+        :param pid: Process ID
+        :return: Memory in KB, 0 if the process is gone
+        """
+        for path, field in ((f'/proc/{pid}/smaps_rollup', 'Pss:'), (f'/proc/{pid}/status', 'VmRSS:')):
+            try:
+                with open(path) as f:
+                    for line in f:
+                        if line.startswith(field):
+                            return int(line.split()[1])
+            except (OSError, ValueError):
+                continue
+        return 0
+
+    def _memory_mb(self, driver: webdriver.Chrome) -> float:
+        """
+        Measure the memory of the ChromeDriver process and every browser process it started (blocking)
+        
+        :param driver: Chrome WebDriver
+        :return: Memory in MB, 0 if unavailable (e.g. on systems without /proc)
+        """
+        try:
+            pid = driver.service.process.pid
+            return sum(self._process_memory_kb(child) for child in self._process_tree(pid)) / 1024
+        except (AttributeError, OSError):
+            return 0
+
+    @staticmethod
+    def _quit(driver: webdriver.Chrome):
+        """
+        Quit a browser, ignoring sessions that already died
+        
+        :param driver: Chrome WebDriver
         """
         try:
-            self.driver.get('https://google.com')
+            driver.quit()
+        except Exception as quit_error:
+            logger.warning(f"Error closing browser: {quit_error}")
+
+    async def _discard(self, driver: webdriver.Chrome):
+        """
+        Remove a browser from the pool and quit it
+        
+        :param driver: Chrome WebDriver
+        """
+        self._all.discard(driver)
+        self._uses.pop(driver, None)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._quit, driver)
+        
+        # Wake up one waiter so it can start a replacement browser
+        self._idle.put_nowait(None)
+
+    async def acquire(self) -> webdriver.Chrome:
+        """
+        Take a healthy browser from the pool, starting one if below the pool size
+        
+        :return: Chrome WebDriver
+        """
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            self._lock = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            driver = None
+            async with self._lock:
+                if self._idle.empty() and len(self._all) < self.size:
+                    driver = await loop.run_in_executor(None, self._create_driver)
+                    self._all.add(driver)
+                    self._uses[driver] = 0
+                    logger.info(f"Started browser {len(self._all)}/{self.size}")
+                    return driver
             
-            # Wait for search bar
-            search_bar = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.NAME, "q"))
-            )
+            driver = await self._idle.get()
+            if driver is None:
+                continue
             
-            # Construct search query
-            search_query = f"site:instagram.com {keyword} reel"
-            search_bar.clear()
-            search_bar.send_keys(search_query)
+            # Replace browsers whose session died while idle
+            if await loop.run_in_executor(None, self._is_healthy, driver):
+                return driver
+            logger.warning("Discarding unresponsive browser")
+            await self._discard(driver)
+
+    async def release(self, driver: webdriver.Chrome):
+        """
+        Return a browser to the pool, recycling it when worn out
+        
+        :param driver: Chrome WebDriver
+        """
+        if driver not in self._all:
+            return
+        
+        self._uses[driver] += 1
+        loop = asyncio.get_running_loop()
+        memory_mb = await loop.run_in_executor(None, self._memory_mb, driver)
+        
+        if self._uses[driver] >= self.max_uses or memory_mb > self.max_memory_mb:
+            logger.info(
+                f"Recycling browser after {self._uses[driver]} uses "
+                f"({memory_mb:.0f} MB)"
+            )
+            await self._discard(driver)
+            return
+        
+        self._idle.put_nowait(driver)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[webdriver.Chrome]:
+        """
+        Borrow a browser for the duration of an ``async with`` block
+        
+        :return: Chrome WebDriver
+        """
+        driver = await self.acquire()
+        try:
+            yield driver
+        finally:
+            await self.release(driver)
+
+    def close(self):
+        """
+        Quit every browser owned by the pool
+        """
+        for driver in list(self._all):
+            self._quit(driver)
+        self._all.clear()
+        self._uses.clear()
+        self._idle = None
+        self._lock = None
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Decide whether a failed operation is worth retrying
+    
+    :param error: Exception raised by the operation
+    :return: True for network failures, timeouts, browser errors, throttling and 5xx responses
+    """
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in (408, 429) or error.status >= 500
+    if isinstance(error, (
+        instaloader.exceptions.QueryReturnedNotFoundException,
+        instaloader.exceptions.QueryReturnedForbiddenException,
+        instaloader.exceptions.LoginRequiredException,
+        instaloader.exceptions.PrivateProfileNotFollowedException
+    )):
+        return False
+    return isinstance(error, (
+        instaloader.exceptions.ConnectionException,
+        requests.RequestException,
+        aiohttp.ClientError,
+        asyncio.TimeoutError,
+        ConnectionError,
+        WebDriverException
+    ))
+
+class RetryPolicy:
+    def __init__(
+        self,
+        name: str,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        budget_ratio: float = 0.2,
+        min_retries: int = 10,
+        should_retry: Callable[[BaseException], bool] = is_transient_error
+    ):
+        """
+        Retry an operation with exponential backoff, full jitter and a retry budget
+        
+        The budget allows min_retries retries plus budget_ratio retries per call
+        made, so a failing dependency cannot multiply the load on it.
+        
+        :param name: Operation name used in log messages
+        :param max_attempts: Attempts per call, including the first
+        :param base_delay: Backoff before the first retry, in seconds
+        :param max_delay: Upper bound on any single backoff, in seconds
+        :param budget_ratio: Retries earned per call made
+        :param min_retries: Retries always available regardless of traffic
+        :param should_retry: Predicate deciding which exceptions are retried
+        """
+        self.name = name
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_ratio = budget_ratio
+        self.min_retries = min_retries
+        self.should_retry = should_retry
+        self.calls = 0
+        self.retries = 0
+
+    def _budget_allows_retry(self) -> bool:
+        return self.retries < self.min_retries + self.budget_ratio * self.calls
+
+    async def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Await func(*args, **kwargs), retrying transient failures
+        
+        :param func: Coroutine function performing one attempt
+        :return: Result of the first successful attempt
+        """
+        self.calls += 1
+        attempt = 1
+        while True:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if (
+                    attempt >= self.max_attempts
+                    or not self.should_retry(e)
+                    or not self._budget_allows_retry()
+                ):
+                    raise
+                
+                self.retries += 1
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+                logger.warning(
+                    f"{self.name} attempt {attempt}/{self.max_attempts} failed: {e}, "
+                    f"retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+def default_retry_policies() -> Dict[str, RetryPolicy]:
+    """
+    Build the retry policy for each pipeline operation
+    
+    :return: Policies keyed by operation: search, fetch, upload_url, put, create_post
+    """
+    return {
+        'search': RetryPolicy('search', max_attempts=3, base_delay=2.0),
+        'fetch': RetryPolicy('fetch', max_attempts=4, base_delay=2.0, max_delay=60.0),
+        'upload_url': RetryPolicy('upload_url', max_attempts=4),
+        'put': RetryPolicy('put', max_attempts=3, base_delay=2.0),
+        'create_post': RetryPolicy('create_post', max_attempts=3)
+    }
+
+GOOGLE_SEARCH_URL = 'https://www.google.com/search'
+RESULTS_PER_PAGE = 10
+SEARCH_RESULT_XPATH = "//div[@class='MjjYud']//a"
+NO_RESULTS_XPATH = "//p[contains(normalize-space(.), 'did not match any documents')]"
+
+# Collects the href of every node matching an XPath in one WebDriver round trip
+EXTRACT_HREFS_SCRIPT = """
+const snapshot = document.evaluate(
+    arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+);
+const hrefs = [];
+for (let i = 0; i < snapshot.snapshotLength; i++) {
+    hrefs.push(snapshot.snapshotItem(i).href);
+}
+return hrefs;
+"""
+
+def build_search_params(query: str, page: int) -> Dict[str, Any]:
+    """
+    Build the query string for one Google results page
+    
+    :param query: Search query
+    :param page: Zero-based results page
+    :return: Query parameters
+    """
+    return {'q': query, 'start': page * RESULTS_PER_PAGE, 'hl': 'en'}
+
+def filter_video_links(hrefs: List[str], max_videos: int, marker: str = '/reel/') -> List[str]:
+    """
+    Keep video links from search results, without duplicates
+    
+    :param hrefs: Result URLs in page order
+    :param max_videos: Maximum number of links to keep
+    :param marker: Path fragment that identifies a video link
+    :return: List of video links
+    """
+    video_links = []
+    for href in hrefs:
+        if href and marker in href and href not in video_links:
+            video_links.append(href)
             
-            # Submit search
-            search_bar.send_keys(Keys.RETURN)
+            # Stop if max videos reached
+            if len(video_links) >= max_videos:
+                break
+    return video_links
+
+class SearchBackend:
+    """
+    Interface for backends that turn a search query into video links
+    
+    Backends implement ``fetch_page``; paging, filtering and de-duplication
+    are shared.
+    """
+
+    def __init__(self, max_pages: int = 5, retry_policy: Optional[RetryPolicy] = None):
+        """
+        :param max_pages: Maximum number of result pages walked per search
+        :param retry_policy: Retry policy for each results page
+        """
+        self.max_pages = max_pages
+        self.retry_policy = retry_policy or default_retry_policies()['search']
+
+    async def fetch_page(self, query: str, page: int) -> List[str]:
+        """
+        Fetch one results page and return every result URL on it
+        
+        :param query: Search query
+        :param page: Zero-based results page
+        :return: Result URLs in page order, empty when there are no more results
+        """
+        raise NotImplementedError
+
+    async def iter_links(
+        self,
+        query: str,
+        max_videos: int = 10,
+        marker: str = '/reel/',
+        outcome: Optional[Dict[str, bool]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Walk result pages and yield video links as soon as each page is parsed
+        
+        :param query: Search query
+        :param max_videos: Maximum number of videos to yield
+        :param marker: Path fragment that identifies a video link
+        :param outcome: Filled with 'exhausted', True once an empty page followed a page of results
+        :return: Async iterator of video links
+        """
+        if outcome is not None:
+            outcome['exhausted'] = False
+        
+        seen: Set[str] = set()
+        for page in range(self.max_pages):
+            hrefs = await self.retry_policy.call(self.fetch_page, query, page)
+            if not hrefs:
+                # An empty first page may be a consent or CAPTCHA page rather than the end of the results
+                if outcome is not None:
+                    outcome['exhausted'] = page > 0
+                break
             
-            # Wait for search results
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//div[@class='MjjYud']//a"))
+            for link in filter_video_links(hrefs, len(hrefs), marker):
+                if link in seen:
+                    continue
+                seen.add(link)
+                yield link
+                
+                # Stop if max videos reached
+                if len(seen) >= max_videos:
+                    return
+
+    async def close(self):
+        """
+        Release resources held by the backend
+        """
+
+class SeleniumSearchBackend(SearchBackend):
+    def __init__(self, browser_pool: Optional[BrowserPool] = None, max_pages: int = 5):
+        """
+        Search Google in pooled headless Chrome sessions
+        
+        :param browser_pool: Shared browser pool, a single-browser pool is created if omitted
+        :param max_pages: Maximum number of result pages walked per search
+        """
+        super().__init__(max_pages)
+        
+        # Browsers are started lazily on the first search and reused afterwards
+        self._owns_browser_pool = browser_pool is None
+        self.browser_pool = browser_pool or BrowserPool(size=1)
+
+    async def fetch_page(self, query: str, page: int) -> List[str]:
+        """
+        Load one Google results page on a pooled browser
+        
+        :param query: Search query
+        :param page: Zero-based results page
+        :return: Result URLs in page order
+        """
+        async with self.browser_pool.session() as driver:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                self._fetch_page_sync,
+                driver,
+                query,
+                page
             )
+
+    @staticmethod
+    def _fetch_page_sync(driver: webdriver.Chrome, query: str, page: int) -> List[str]:
+        """
+        Load one Google results page in the given browser (blocking)
+        
+        :param driver: Chrome WebDriver borrowed from the pool
+        :param query: Search query
+        :param page: Zero-based results page
+        :return: Result URLs in page order, empty on Google's no-results page
+        :raises TimeoutException: Neither results nor the no-results notice appeared,
+            e.g. on a consent or CAPTCHA page
+        """
+        driver.get(f"{GOOGLE_SEARCH_URL}?{urlencode(build_search_params(query, page))}")
+        
+        # Wait for search results or the notice that there are none, anything else is retried
+        try:
+            WebDriverWait(driver, 10).until(EC.any_of(
+                EC.presence_of_all_elements_located((By.XPATH, SEARCH_RESULT_XPATH)),
+                EC.presence_of_element_located((By.XPATH, NO_RESULTS_XPATH))
+            ))
+        except TimeoutException as e:
+            raise TimeoutException(f"Results page {page} for '{query}' did not load") from e
+        
+        # Read every result href in a single script call
+        return driver.execute_script(EXTRACT_HREFS_SCRIPT, SEARCH_RESULT_XPATH) or []
+
+    async def close(self):
+        """
+        Close the browser pool if this backend created it
+        """
+        if self._owns_browser_pool:
+            self.browser_pool.close()
+
+class HttpSearchBackend(SearchBackend):
+    def __init__(
+        self,
+        search_url: str = GOOGLE_SEARCH_URL,
+        timeout: float = 10,
+        user_agent: str = 'Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0',
+        max_pages: int = 5
+    ):
+        """
+        Search Google with plain HTTP requests and parse the result HTML
+        
+        :param search_url: Search endpoint
+        :param timeout: Request timeout in seconds
+        :param user_agent: User-Agent header sent with each search
+        :param max_pages: Maximum number of result pages walked per search
+        """
+        super().__init__(max_pages)
+        self.search_url = search_url
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.headers = {'User-Agent': user_agent, 'Accept-Language': 'en'}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use
+        
+        :return: aiohttp session
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                headers=self.headers
+            )
+        return self._session
+
+    @staticmethod
+    def _parse_links(html: str) -> List[str]:
+        """
+        Extract result URLs from a Google results page
+        
+        :param html: Results page HTML
+        :return: Result URLs in page order
+        """
+        soup = BeautifulSoup(html, 'lxml')
+        links = []
+        for anchor in soup.find_all('a', href=True):
+            href = anchor['href']
             
-            # Find result links
-            result_links = self.driver.find_elements(By.XPATH, "//div[@class='MjjYud']//a")
-            
-            # Filter Instagram Reel links
-            reel_links = []
-            for link in result_links:
-                try:
-                    href = link.get_attribute('href')
-                    if href and '/reel/' in href:
-                        reel_links.append(href)
-                        
-                        # Stop if max videos reached
-                        if len(reel_links) >= max_videos:
-                            break
-                except Exception as link_error:
-                    logger.warning(f"Error processing link: {link_error}")
-            
-            logger.info(f"Found {len(reel_links)} Reel links")
-            return reel_links
+            # Plain HTML results wrap the target as /url?q=<target>
+            if href.startswith('/url?'):
+                href = parse_qs(urlparse(href).query).get('q', [''])[0]
+            if href.startswith('http'):
+                links.append(href)
+        return links
+
+    async def fetch_page(self, query: str, page: int) -> List[str]:
+        """
+        Fetch one Google results page with a single HTTP request
         
-        except Exception as e:
-            logger.error(f"Search failed: {e}")
-            return []
+        :param query: Search query
+        :param page: Zero-based results page
+        :return: Result URLs in page order
+        """
+        params = build_search_params(query, page)
+        async with self._get_session().get(self.search_url, params=params) as response:
+            response.raise_for_status()
+            html = await response.text()
+        return self._parse_links(html)
+
+    async def close(self):
+        """
+        Close the HTTP session
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+# Read size used when hashing video files
+HASH_BUFFER_SIZE = 1024 * 1024
+
+def hash_file(file_path: str, buffer_size: int = HASH_BUFFER_SIZE) -> str:
+    """
+    Compute the SHA-256 of a file, reading into one reusable buffer
+    
+    :param file_path: Path to the file
+    :param buffer_size: Bytes read per call
+    :return: Hex digest
+    """
+    return file_sha256(file_path, buffer_size).hexdigest()
 
-    async def download_video(self, video_url: str, index: int) -> Optional[str]:
+def file_sha256(file_path: str, buffer_size: int = HASH_BUFFER_SIZE) -> 'hashlib._Hash':
+    """
+    Feed a file into a SHA-256 object that more data can still be added to
+    
+    :param file_path: Path to the file
+    :param buffer_size: Bytes read per call
+    :return: SHA-256 hash object
+    """
+    sha256_hash = hashlib.sha256()
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as f:
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            sha256_hash.update(view[:read])
+    return sha256_hash
+
+def update_sha256_from_file(
+    sha256_hash: 'hashlib._Hash',
+    file_path: str,
+    offset: int,
+    length: int,
+    buffer_size: int = HASH_BUFFER_SIZE
+):
+    """
+    Feed a byte range of a file into a SHA-256 object (blocking)
+    
+    :param sha256_hash: SHA-256 object to update
+    :param file_path: Path to the file
+    :param offset: First byte of the range
+    :param length: Length of the range in bytes
+    :param buffer_size: Bytes read per call
+    """
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as f:
+        f.seek(offset)
+        while length > 0:
+            read = f.readinto(view[:min(buffer_size, length)])
+            if not read:
+                raise EOFError(f"{file_path} ended before byte {offset + length}")
+            sha256_hash.update(view[:read])
+            length -= read
+
+def parse_content_range(header: Optional[str]) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse a ``Content-Range: bytes start-end/total`` response header
+    
+    :param header: Header value
+    :return: First byte, last byte and total size, or None if missing or the total is unknown
+    """
+    if not header or not header.startswith('bytes '):
+        return None
+    try:
+        byte_range, total = header[len('bytes '):].split('/')
+        start, end = byte_range.split('-')
+        return int(start), int(end), int(total)
+    except ValueError:
+        return None
+
+# Digest recorded next to each downloaded video so uploads do not re-read it
+DIGEST_SIDECAR_SUFFIX = '.sha256.json'
+
+def write_digest_sidecar(file_path: str, file_hash: str, file_size: int):
+    """
+    Record a file's digest alongside it
+    
+    :param file_path: Path to the video file
+    :param file_hash: SHA-256 of the file
+    :param file_size: Size of the file in bytes
+    """
+    with open(file_path + DIGEST_SIDECAR_SUFFIX, 'w') as f:
+        json.dump({
+            'sha256': file_hash,
+            'size': file_size,
+            'mtime_ns': os.stat(file_path).st_mtime_ns
+        }, f)
+
+def read_digest_sidecar(file_path: str) -> Optional[Tuple[str, int]]:
+    """
+    Read a recorded digest, ignoring it if the file changed since
+    
+    :param file_path: Path to the video file
+    :return: SHA-256 and size, or None if missing or stale
+    """
+    try:
+        with open(file_path + DIGEST_SIDECAR_SUFFIX) as f:
+            digest = json.load(f)
+        stat = os.stat(file_path)
+    except (OSError, ValueError):
+        return None
+    
+    if digest.get('size') != stat.st_size or digest.get('mtime_ns') != stat.st_mtime_ns:
+        return None
+    return digest['sha256'], digest['size']
+
+def remove_video(file_path: str):
+    """
+    Delete a video file together with its digest sidecar
+    
+    :param file_path: Path to the video file
+    """
+    os.remove(file_path)
+    try:
+        os.remove(file_path + DIGEST_SIDECAR_SUFFIX)
+    except FileNotFoundError:
+        pass
+
+# Progress of an interrupted media download, kept next to its .part file
+PARTIAL_STATE_SUFFIX = '.json'
+
+# Bytes streamed between two progress checkpoints of a single-stream download
+PARTIAL_CHECKPOINT_BYTES = 4 * 1024 * 1024
+
+def read_partial_state(part_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the progress recorded for a partial download
+    
+    :param part_path: Path to the .part file
+    :return: Recorded progress, or None if there is nothing to resume
+    """
+    try:
+        with open(part_path + PARTIAL_STATE_SUFFIX) as f:
+            state = json.load(f)
+        part_size = os.path.getsize(part_path)
+    except (OSError, ValueError):
+        return None
+    
+    # The .part file must still hold every byte recorded as verified
+    if 'offset' in state and part_size < state['offset']:
+        return None
+    if 'segments' in state and part_size != state.get('size'):
+        return None
+    return state
+
+def write_partial_state(part_path: str, state: Dict[str, Any]):
+    """
+    Record the progress of a partial download
+    
+    :param part_path: Path to the .part file
+    :param state: Validators and verified byte ranges
+    """
+    with open(part_path + PARTIAL_STATE_SUFFIX, 'w') as f:
+        json.dump(state, f)
+
+def remove_partial(part_path: str):
+    """
+    Delete a partial download together with its progress record
+    
+    :param part_path: Path to the .part file
+    """
+    for path in (part_path, part_path + PARTIAL_STATE_SUFFIX):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+def response_validators(response: aiohttp.ClientResponse) -> Dict[str, Optional[str]]:
+    """
+    Get the validators identifying the version of a media file
+    
+    Weak ETags cannot be used in If-Range, so only strong ones are kept.
+    
+    :param response: Media response
+    :return: ETag and Last-Modified, None when absent
+    """
+    etag = response.headers.get('ETag')
+    if etag and etag.startswith('W/'):
+        etag = None
+    return {'etag': etag, 'last_modified': response.headers.get('Last-Modified')}
+
+def if_range(state: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the If-Range value that resumes a partial download only if the file is unchanged
+    
+    :param state: Recorded progress with validators
+    :return: ETag or Last-Modified, None if neither was recorded
+    """
+    return state.get('etag') or state.get('last_modified')
+
+# Local SQLite database holding the bot's persistent state
+STATE_DB_PATH = 'bot_state.db'
+
+class SearchCache:
+    def __init__(self, db_path: str = STATE_DB_PATH, ttl: int = 6 * 60 * 60):
         """
-        Download video from Instagram link using Instaloader
+        On-disk cache of search results keyed by normalized search query
         
-        :param video_url: URL of the Instagram video
-        :param index: Index of the video for naming
-        :return: Path to downloaded video or None
+        :param db_path: SQLite database file
+        :param ttl: Seconds before a cached result is considered stale
+        """
+        self.ttl = ttl
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS search_cache (
+                query TEXT PRIMARY KEY,
+                links TEXT NOT NULL,
+                exhausted INTEGER NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self.evict_expired()
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """
+        Normalize a search query into its cache key
+        
+        :param query: Search query
+        :return: Normalized search query
+        """
+        return ' '.join(query.lower().split())
+
+    def get(self, query: str, max_videos: int) -> Optional[List[str]]:
+        """
+        Get fresh cached links that can satisfy a search
+        
+        :param query: Search query
+        :param max_videos: Number of videos the caller needs
+        :return: Cached video links, or None on a miss
+        """
+        row = self.conn.execute(
+            "SELECT links, exhausted FROM search_cache WHERE query = ? AND created_at >= ?",
+            (self.normalize(query), time.time() - self.ttl)
+        ).fetchone()
+        if row is None:
+            return None
+        
+        links = json.loads(row[0])
+        
+        # A shorter result is only usable if the search had run out of results
+        if len(links) < max_videos and not row[1]:
+            return None
+        return links[:max_videos]
+
+    def put(self, query: str, links: List[str], exhausted: bool):
+        """
+        Store the links found for a search query
+        
+        :param query: Search query
+        :param links: Video links found
+        :param exhausted: Whether the search ran out of results before its limit
+        """
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?)",
+                (self.normalize(query), json.dumps(links), int(exhausted), time.time())
+            )
+
+    def evict_expired(self):
+        """
+        Delete stale cache entries
+        """
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM search_cache WHERE created_at < ?",
+                (time.time() - self.ttl,)
+            )
+
+    def close(self):
+        """
+        Close the database connection
+        """
+        self.conn.close()
+
+class DedupIndex:
+    def __init__(self, db_path: str = STATE_DB_PATH):
+        """
+        Persistent index of downloaded shortcodes and uploaded content hashes
+        
+        :param db_path: SQLite database file
+        """
+        self.conn = sqlite3.connect(db_path)
+        with self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS downloaded_shortcodes (
+                    shortcode TEXT PRIMARY KEY,
+                    path TEXT NOT NULL,
+                    downloaded_at REAL NOT NULL
+                )
+                """
+            )
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS uploaded_hashes (
+                    hash TEXT PRIMARY KEY,
+                    post_id TEXT,
+                    uploaded_at REAL NOT NULL
+                )
+                """
+            )
+
+    def get_download(self, shortcode: str) -> Optional[str]:
+        """
+        Look up a previously downloaded shortcode
+        
+        :param shortcode: Instagram shortcode
+        :return: Path the video was saved to, or None if never downloaded
+        """
+        row = self.conn.execute(
+            "SELECT path FROM downloaded_shortcodes WHERE shortcode = ?",
+            (shortcode,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def add_download(self, shortcode: str, path: str):
+        """
+        Record a downloaded shortcode
+        
+        :param shortcode: Instagram shortcode
+        :param path: Path the video was saved to
+        """
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO downloaded_shortcodes VALUES (?, ?, ?)",
+                (shortcode, path, time.time())
+            )
+
+    def remove_download(self, shortcode: str):
+        """
+        Forget a downloaded shortcode so it is downloaded again
+        
+        :param shortcode: Instagram shortcode
+        """
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM downloaded_shortcodes WHERE shortcode = ?",
+                (shortcode,)
+            )
+
+    def get_upload(self, file_hash: str) -> Optional[dict]:
+        """
+        Look up previously uploaded content
+        
+        :param file_hash: SHA-256 of the video file
+        :return: Recorded post, or None if never uploaded
+        """
+        row = self.conn.execute(
+            "SELECT post_id FROM uploaded_hashes WHERE hash = ?",
+            (file_hash,)
+        ).fetchone()
+        return {"id": row[0], "duplicate": True} if row else None
+
+    def add_upload(self, file_hash: str, post_id: Optional[str]):
+        """
+        Record uploaded content
+        
+        :param file_hash: SHA-256 of the video file
+        :param post_id: ID of the created post
+        """
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO uploaded_hashes VALUES (?, ?, ?)",
+                (file_hash, post_id, time.time())
+            )
+
+    def close(self):
+        """
+        Close the database connection
+        """
+        self.conn.close()
+
+class JobStore:
+    # Lifecycle of a video, in order
+    STATES = ('searched', 'downloaded', 'hashed', 'upload_url', 'uploaded', 'posted')
+    
+    # Terminal state of a job that kept failing, it is no longer resumed
+    FAILED = 'failed'
+
+    def __init__(self, db_path: str = STATE_DB_PATH, max_attempts: int = 3):
+        """
+        Durable record of each video's progress through search, download and upload
+        
+        :param db_path: SQLite database file
+        :param max_attempts: Failed attempts after which a job is given up
+        """
+        self.max_attempts = max_attempts
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        with self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    keyword TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    file_path TEXT,
+                    file_hash TEXT,
+                    file_size INTEGER,
+                    upload_url TEXT,
+                    remote_hash TEXT,
+                    post_id TEXT,
+                    error TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            
+            # Databases created before failed attempts were counted
+            columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+            if 'attempts' not in columns:
+                self.conn.execute("ALTER TABLE jobs ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0")
+
+    def add(self, job_id: str, keyword: str, url: str) -> bool:
+        """
+        Record a video found by a search
+        
+        :param job_id: Unique video ID (Instagram shortcode)
+        :param keyword: Search keyword that found it
+        :param url: URL of the video
+        :return: False if the video already has a job
+        """
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO jobs (job_id, keyword, url, state, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, keyword, url, 'searched', time.time())
+            )
+        return cursor.rowcount == 1
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """
+        Look up a job
+        
+        :param job_id: Unique video ID
+        :return: Job fields, or None if unknown
+        """
+        row = self.conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def update(self, job_id: str, state: Optional[str] = None, **fields):
+        """
+        Record a state transition and any data produced by the finished step
+        
+        :param job_id: Unique video ID
+        :param state: New state, unchanged if omitted
+        :param fields: Job columns to set, e.g. file_path or post_id
+        """
+        if state is not None:
+            fields['state'] = state
+        fields['updated_at'] = time.time()
+        assignments = ', '.join(f"{column} = ?" for column in fields)
+        with self.conn:
+            self.conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE job_id = ?",
+                (*fields.values(), job_id)
+            )
+
+    def record_failure(self, job_id: str, error: str) -> bool:
+        """
+        Record a failed attempt, giving the job up once it failed max_attempts times
+        
+        :param job_id: Unique video ID
+        :param error: Description of the failure
+        :return: True if the job is now given up
+        """
+        with self.conn:
+            self.conn.execute(
+                "UPDATE jobs SET attempts = attempts + 1, error = ?, updated_at = ? WHERE job_id = ?",
+                (error, time.time(), job_id)
+            )
+            cursor = self.conn.execute(
+                "UPDATE jobs SET state = ? WHERE job_id = ? AND attempts >= ?",
+                (self.FAILED, job_id, self.max_attempts)
+            )
+        if cursor.rowcount:
+            logger.warning(f"Giving up on job {job_id} after {self.max_attempts} failed attempts: {error}")
+        return cursor.rowcount == 1
+
+    def unfinished(self) -> List[dict]:
+        """
+        Jobs that were interrupted before their post was created and not given up
+        
+        :return: Job fields, oldest first
+        """
+        rows = self.conn.execute(
+            "SELECT * FROM jobs WHERE state NOT IN ('posted', ?) ORDER BY updated_at",
+            (self.FAILED,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self):
+        """
+        Close the database connection
+        """
+        self.conn.close()
+
+def extract_shortcode(video_url: str) -> Optional[str]:
+    """
+    Extract the Instagram shortcode from a Reel URL
+    
+    :param video_url: URL of the Instagram video
+    :return: Shortcode, or None if the URL is not a Reel link
+    """
+    match = re.search(r'/reel/([^/?#]+)', video_url)
+    return match.group(1) if match else None
+
+def is_throttled_error(error: BaseException) -> bool:
+    """
+    Detect Instagram rate limiting: HTTP 429 or a redirect to the login page
+    
+    :param error: Exception raised by an Instaloader call
+    :return: True if Instagram is throttling this session
+    """
+    return (
+        isinstance(error, instaloader.exceptions.TooManyRequestsException)
+        or 'redirected to login' in str(error).lower()
+    )
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        """
+        Token bucket refilled continuously at a fixed rate
+        
+        :param rate: Tokens added per second
+        :param burst: Maximum tokens held at once
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until_token(self) -> float:
+        """
+        Seconds until a token is available
+        
+        :return: 0 if a token can be taken now
+        """
+        self._refill()
+        return 0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self):
+        """
+        Consume one token
+        """
+        self._refill()
+        self.tokens -= 1
+
+class InstagramScheduler:
+    def __init__(
+        self,
+        rate: float = 0.5,
+        burst: int = 5,
+        min_rate: float = 0.02,
+        cooldown: float = 60.0,
+        recovery: float = 1.05
+    ):
+        """
+        Pace Instagram requests with a token bucket, serving keywords round-robin
+        
+        Throttling responses halve the rate and pause all requests for the
+        cooldown; each success then raises the rate again by the recovery
+        factor, up to the configured rate.
+        
+        :param rate: Sustained requests per second
+        :param burst: Requests allowed back to back
+        :param min_rate: Lowest rate adaptive slowdown can reach
+        :param cooldown: Seconds to pause after Instagram throttles
+        :param recovery: Rate multiplier applied after each successful request
+        """
+        self.base_rate = rate
+        self.min_rate = min_rate
+        self.cooldown = cooldown
+        self.recovery = recovery
+        self.bucket = TokenBucket(rate, burst)
+        self._cooldown_until = 0.0
+        self._queues: 'OrderedDict[str, deque]' = OrderedDict()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    async def acquire(self, key: str = ''):
+        """
+        Wait for this caller's turn and a free token
+        
+        :param key: Fairness key, e.g. the search keyword; keys are served round-robin
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(key, deque()).append(waiter)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+        await waiter
+
+    async def _dispatch(self):
+        """
+        Hand out tokens to waiting callers, one key at a time
+        """
+        while self._queues:
+            wait = max(self._cooldown_until - time.monotonic(), self.bucket.time_until_token())
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            
+            key, waiters = next(iter(self._queues.items()))
+            waiter = waiters.popleft()
+            
+            # Move the key to the back of the rotation
+            if waiters:
+                self._queues.move_to_end(key)
+            else:
+                del self._queues[key]
+            
+            if waiter.done():
+                continue
+            self.bucket.take()
+            waiter.set_result(None)
+
+    def delay(self) -> float:
+        """
+        Estimate how long a new request would wait behind the queued ones
+        
+        :return: Estimated wait in seconds
+        """
+        pending = sum(len(waiters) for waiters in self._queues.values())
+        ready_in = max(self._cooldown_until - time.monotonic(), self.bucket.time_until_token())
+        return max(ready_in, 0) + pending / self.bucket.rate
+
+    def report_throttled(self):
+        """
+        Slow down after Instagram throttled a request
+        """
+        self.bucket.rate = max(self.min_rate, self.bucket.rate / 2)
+        self.bucket.tokens = 0
+        self._cooldown_until = time.monotonic() + self.cooldown
+        logger.warning(
+            f"Instagram is throttling, pausing {self.cooldown:.0f}s "
+            f"and slowing to {self.bucket.rate:.2f} requests/s"
+        )
+
+    def report_success(self):
+        """
+        Recover the request rate after a successful request
+        """
+        self.bucket.rate = min(self.base_rate, self.bucket.rate * self.recovery)
+
+    async def run(self, key: str, func: Callable[..., Any], *args) -> Any:
+        """
+        Await func(*args) once scheduled, feeding its outcome back into the pacing
+        
+        :param key: Fairness key, e.g. the search keyword
+        :param func: Coroutine function making Instagram requests
+        :return: Result of func
+        """
+        await self.acquire(key)
+        try:
+            result = await func(*args)
+        except Exception as e:
+            if is_throttled_error(e):
+                self.report_throttled()
+            raise
+        self.report_success()
+        return result
+
+class InstaloaderSessionPool:
+    def __init__(
+        self,
+        size: int = 3,
+        usernames: Optional[List[str]] = None,
+        rate: float = 0.5,
+        burst: int = 5
+    ):
+        """
+        Pool of independent Instaloader contexts, each with its own cookies and rate budget
+        
+        Each fetch goes to the session expected to serve it soonest, so a
+        session cooling down after throttling is left alone while the others
+        keep working.
+        
+        :param size: Number of anonymous sessions, ignored when usernames are given
+        :param usernames: Accounts whose saved Instaloader session files are loaded, one session each
+        :param rate: Sustained requests per second for each session
+        :param burst: Requests each session may make back to back
+        """
+        self.sessions: List[Dict[str, Any]] = []
+        for name in usernames or [f"anonymous-{i + 1}" for i in range(size)]:
+            # Retries are left to the downloader's retry policy
+            loader = instaloader.Instaloader(
+                download_videos=True,
+                download_video_thumbnails=False,
+                download_geotags=False,
+                download_comments=False,
+                download_pictures=False,
+                save_metadata=False,
+                compress_json=False,
+                dirname_pattern='{target}',
+                max_connection_attempts=1
+            )
+            loader.quiet = True
+            if usernames:
+                loader.load_session_from_file(name)
+            
+            self.sessions.append({
+                "name": name,
+                "loader": loader,
+                "scheduler": InstagramScheduler(rate=rate, burst=burst)
+            })
+        self._next = 0
+
+    def pick(self) -> Dict[str, Any]:
+        """
+        Choose the session that would serve a new request soonest, rotating on ties
+        
+        :return: Session dict with name, loader and scheduler
+        """
+        count = len(self.sessions)
+        order = [self.sessions[(self._next + i) % count] for i in range(count)]
+        session = min(order, key=lambda candidate: candidate["scheduler"].delay())
+        self._next = (self.sessions.index(session) + 1) % count
+        return session
+
+    async def run(self, key: str, func: Callable[..., Any], *args) -> Any:
+        """
+        Await func(loader, *args) on the least busy session, within its rate budget
+        
+        :param key: Fairness key, e.g. the search keyword
+        :param func: Coroutine function taking an Instaloader instance first
+        :return: Result of func
+        """
+        session = self.pick()
+        try:
+            return await session["scheduler"].run(key, func, session["loader"], *args)
+        except Exception as e:
+            if is_throttled_error(e):
+                logger.warning(f"Instagram session {session['name']} throttled, shifting load to the others")
+            raise
+
+    def close(self):
+        """
+        Close every session's HTTP connections
+        """
+        for session in self.sessions:
+            session["loader"].close()
+
+def find_json_value(data: Any, key: str) -> Optional[Any]:
+    """
+    Find the first non-empty value stored under a key anywhere in decoded JSON
+    
+    :param data: Decoded JSON document
+    :param key: Key to look for
+    :return: Value, or None if the key does not occur
+    """
+    if isinstance(data, dict):
+        if data.get(key):
+            return data[key]
+        children = data.values()
+    elif isinstance(data, list):
+        children = data
+    else:
+        return None
+    
+    for child in children:
+        value = find_json_value(child, key)
+        if value is not None:
+            return value
+    return None
+
+class VideoSource:
+    """
+    Interface for the platforms videos are collected from
+    
+    A source knows how to search for its videos, recognise and name their
+    links, and resolve a video link to a direct media URL. Fetching the media,
+    concurrency, caching and de-duplication are shared by VideoDownloader.
+    """
+    
+    # Short name used in file names and dedup keys
+    name = ''
+    # Domain passed to the site: search operator
+    site = ''
+    # Path fragment identifying video links in search results
+    link_marker = ''
+    # Extra word appended to searches
+    search_term = ''
+    # Label of the videos in post titles
+    label = ''
+    # Headers sent with media requests
+    media_headers: Dict[str, str] = {}
+
+    def search_query(self, keyword: str) -> str:
+        """
+        Build the Google query used to find this platform's videos for a keyword
+        
+        :param keyword: Search keyword
+        :return: Search query
+        """
+        return f"site:{self.site} {keyword} {self.search_term}".strip()
+
+    def owns(self, video_url: str) -> bool:
+        """
+        Check whether a link belongs to this platform
+        
+        :param video_url: URL of the video
+        :return: True if the link's host is on this platform's domain
+        """
+        host = urlparse(video_url).hostname or ''
+        return host == self.site or host.endswith('.' + self.site)
+
+    def video_id(self, video_url: str) -> Optional[str]:
+        """
+        Extract the platform's video ID from a link
+        
+        :param video_url: URL of the video
+        :return: Video ID, or None if the link is not a video
+        """
+        raise NotImplementedError
+
+    def video_key(self, video_id: str) -> str:
+        """
+        Build the key a video is tracked under in the dedup index and job store
+        
+        :param video_id: Video ID
+        :return: Key unique across platforms
+        """
+        return f"{self.name}:{video_id}"
+
+    async def resolve(self, downloader: 'VideoDownloader', video_url: str, video_id: str, keyword: str) -> Optional[str]:
+        """
+        Resolve a video link to its direct media URL
+        
+        :param downloader: Downloader whose engine and HTTP client the lookup may use
+        :param video_url: URL of the video
+        :param video_id: Video ID
+        :param keyword: Search keyword the link came from
+        :return: Media URL, or None if the link has no video
+        """
+        raise NotImplementedError
+
+    async def close(self):
+        """
+        Release resources held by the source
+        """
+
+class InstagramSource(VideoSource):
+    name = 'instagram'
+    site = 'instagram.com'
+    link_marker = '/reel/'
+    search_term = 'reel'
+    label = 'Instagram Reel'
+
+    def __init__(self, session_pool: Optional[InstaloaderSessionPool] = None):
+        """
+        Instagram Reels, resolved through Instaloader
+        
+        :param session_pool: Instaloader sessions that lookups are spread across
+        """
+        self.session_pool = session_pool or InstaloaderSessionPool()
+
+    def video_id(self, video_url: str) -> Optional[str]:
+        return extract_shortcode(video_url)
+
+    def video_key(self, video_id: str) -> str:
+        # Bare shortcodes, as recorded by earlier runs
+        return video_id
+
+    async def resolve(self, downloader: 'VideoDownloader', video_url: str, video_id: str, keyword: str) -> Optional[str]:
+        return await self.session_pool.run(keyword, self._resolve_media_url, downloader.engine, video_id)
+
+    async def _resolve_media_url(
+        self,
+        loader: instaloader.Instaloader,
+        engine: DownloadEngine,
+        shortcode: str
+    ) -> Optional[str]:
+        """
+        Look up a post's video URL with the given session on the download engine
+        
+        :param loader: Instaloader session to query with
+        :param engine: Download engine running the blocking lookup
+        :param shortcode: Shortcode of the post
+        :return: Video URL, or None if the post is not a video
+        """
+        post_url = f"https://www.instagram.com/p/{shortcode}/"
+        return await engine.run(post_url, self._resolve_media_url_sync, loader, shortcode)
+
+    @staticmethod
+    def _resolve_media_url_sync(loader: instaloader.Instaloader, shortcode: str) -> Optional[str]:
+        """
+        Look up a post's video URL using Instaloader (blocking)
+        
+        :param loader: Instaloader session to query with
+        :param shortcode: Shortcode of the post
+        :return: Video URL, or None if the post is not a video
+        """
+        post = instaloader.Post.from_shortcode(loader.context, shortcode)
+        return post.video_url if post.is_video else None
+
+    async def close(self):
+        """
+        Close the Instaloader sessions
+        """
+        self.session_pool.close()
+
+# Script tags holding the page state of a TikTok video page, newest layout first
+TIKTOK_STATE_SCRIPT_IDS = ('__UNIVERSAL_DATA_FOR_REHYDRATION__', 'SIGI_STATE')
+
+class TikTokSource(VideoSource):
+    name = 'tiktok'
+    site = 'tiktok.com'
+    link_marker = '/video/'
+    label = 'TikTok video'
+
+    def __init__(self, user_agent: str = 'Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0'):
+        """
+        TikTok videos, resolved from the playAddr in the video page's state JSON
+        
+        The page is fetched with the downloader's HTTP client, so the cookies
+        TikTok sets there are sent along with the media request.
+        
+        :param user_agent: User-Agent header sent with page and media requests
+        """
+        self.media_headers = {'User-Agent': user_agent, 'Referer': 'https://www.tiktok.com/'}
+
+    def video_id(self, video_url: str) -> Optional[str]:
+        match = re.search(r'/video/(\d+)', video_url)
+        return match.group(1) if match else None
+
+    async def resolve(self, downloader: 'VideoDownloader', video_url: str, video_id: str, keyword: str) -> Optional[str]:
+        html = await downloader.fetch_text(video_url, self.media_headers)
+        return self._parse_play_addr(html)
+
+    @staticmethod
+    def _parse_play_addr(html: str) -> Optional[str]:
+        """
+        Extract the video's media URL from a TikTok video page
+        
+        :param html: Video page HTML
+        :return: Media URL, or None if the page holds no video
+        """
+        soup = BeautifulSoup(html, 'lxml')
+        for script_id in TIKTOK_STATE_SCRIPT_IDS:
+            script = soup.find('script', id=script_id)
+            if script is None or not script.string:
+                continue
+            try:
+                state = json.loads(script.string)
+            except ValueError:
+                continue
+            
+            play_addr = find_json_value(state, 'playAddr')
+            if isinstance(play_addr, str):
+                return play_addr
+        return None
+
+# Sources selectable through VideoDownloader's social_media argument
+VIDEO_SOURCES = {
+    'instagram.com': InstagramSource,
+    'tiktok.com': TikTokSource
+}
+
+class VideoDownloader:
+    def __init__(
+        self,
+        social_media: str,
+        download_path: str = 'downloads',
+        max_workers: int = 5,
+        per_host_limit: int = 3,
+        search_backend: Optional[SearchBackend] = None,
+        search_cache: Optional[SearchCache] = None,
+        dedup_index: Optional[DedupIndex] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        sources: Optional[List[VideoSource]] = None,
+        connect_timeout: float = 10,
+        read_timeout: float = 60,
+        segment_size: Optional[int] = 4 * 1024 * 1024,
+        max_segments: int = 4,
+        segment_threshold: int = 16 * 1024 * 1024
+    ):
+        """
+        Initialize video downloader with a search backend and video sources
+        
+        :param social_media: Platforms to collect from, comma separated, e.g. 'instagram.com,tiktok.com'
+        :param download_path: Directory to save downloaded videos
+        :param max_workers: Number of videos downloaded concurrently
+        :param per_host_limit: Maximum concurrent downloads per host
+        :param search_backend: Backend used to find video links, Selenium if omitted
+        :param search_cache: Cache of previous search results, searches are not cached if omitted
+        :param dedup_index: Index of already downloaded videos, every link is downloaded if omitted
+        :param retry_policy: Retry policy for each media URL lookup and media fetch
+        :param sources: Video sources to use instead of the ones named by social_media
+        :param connect_timeout: Seconds allowed to connect to the media host
+        :param read_timeout: Seconds allowed between two chunks of a media download
+        :param segment_size: Size of the byte ranges large media is fetched in, one stream per file if None
+        :param max_segments: Number of byte ranges of one file fetched at once
+        :param segment_threshold: Fetch media larger than this in byte ranges, smaller files in one stream
+        """
+        self.download_path = download_path
+        os.makedirs(self.download_path, exist_ok=True)
+        
+        # Worker pool running the blocking lookups and capping media downloads
+        self.engine = DownloadEngine(max_workers, per_host_limit)
+        
+        # Pooled HTTP client for media downloads, created inside the event loop
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Segmented download settings for origins honouring Range requests
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        self.segment_threshold = segment_threshold
+        
+        # Search backend used by find_video_links
+        self.search_backend = search_backend or SeleniumSearchBackend()
+        self.search_cache = search_cache
+        self.dedup_index = dedup_index
+        self.retry_policy = retry_policy or default_retry_policies()['fetch']
+        
+        # Platforms searched and downloaded from
+        if sources is None:
+            sources = []
+            for site in social_media.split(','):
+                site = site.strip().lower()
+                if site not in VIDEO_SOURCES:
+                    raise ValueError(f"Unsupported social media platform: {site}")
+                sources.append(VIDEO_SOURCES[site]())
+        self.sources = sources
+
+    def source_for(self, video_url: str) -> Optional[VideoSource]:
+        """
+        Find the source a video link belongs to
+        
+        :param video_url: URL of the video
+        :return: Source, or None if no configured platform owns the link
+        """
+        for source in self.sources:
+            if source.owns(video_url):
+                return source
+        return None
+
+    def video_key(self, video_url: str) -> Optional[str]:
+        """
+        Get the key a video link is tracked under in the dedup index and job store
+        
+        :param video_url: URL of the video
+        :return: Key, or None if the link is not a video of a configured platform
+        """
+        source = self.source_for(video_url)
+        video_id = source.video_id(video_url) if source else None
+        return source.video_key(video_id) if video_id else None
+
+    async def find_video_links(self, keyword: str, max_videos: int = 10) -> List[str]:
+        """
+        Find video links using the configured search backend
+        
+        :param keyword: Search keyword
+        :param max_videos: Maximum number of videos to find per platform
+        :return: List of video links
+        """
+        video_links = [link async for link in self.iter_video_links(keyword, max_videos)]
+        logger.info(f"Found {len(video_links)} video links")
+        return video_links
+
+    async def iter_video_links(self, keyword: str, max_videos: int = 10) -> AsyncIterator[str]:
+        """
+        Yield video links of every platform page by page as the searches progress
+        
+        Fresh cached results are served without searching. Links found before
+        a search error are still yielded, but are not cached. A search is only
+        cached as complete once its results ran out after at least one page
+        of results, and a search that found nothing is otherwise not cached.
+        
+        :param keyword: Search keyword
+        :param max_videos: Maximum number of videos to find per platform
+        :return: Async iterator of video links
+        """
+        for source in self.sources:
+            query = source.search_query(keyword)
+            if self.search_cache is not None:
+                cached_links = self.search_cache.get(query, max_videos)
+                if cached_links is not None:
+                    logger.info(f"Using {len(cached_links)} cached {source.name} links for '{keyword}'")
+                    for link in cached_links:
+                        yield link
+                    continue
+            
+            video_links = []
+            outcome: Dict[str, bool] = {}
+            try:
+                async for link in self.search_backend.iter_links(query, max_videos, source.link_marker, outcome):
+                    video_links.append(link)
+                    yield link
+            except Exception as e:
+                logger.error(f"Search failed: {e}")
+                continue
+            
+            if self.search_cache is not None and (video_links or outcome['exhausted']):
+                self.search_cache.put(query, video_links, exhausted=outcome['exhausted'])
+
+    def part_path(self, video_url: str) -> Optional[str]:
+        """
+        Get the .part file a video is downloaded into
+        
+        The name depends only on the video, so a later run resumes it under
+        whatever index the video gets then.
+        
+        :param video_url: URL of the video
+        :return: Path of the .part file, or None if the link is not a video of a configured platform
+        """
+        source = self.source_for(video_url)
+        video_id = source.video_id(video_url) if source else None
+        if not video_id:
+            return None
+        return os.path.join(self.download_path, f"{source.name}_video_{video_id}.mp4.part")
+
+    async def download_video(
+        self,
+        video_url: str,
+        index: int,
+        keyword: str = '',
+        keep_partial: bool = False
+    ) -> Optional[str]:
+        """
+        Download a video from its link on the download engine's workers
+        
+        :param video_url: URL of the video
+        :param index: Index of the video for naming
+        :param keyword: Search keyword the link came from, used for fair scheduling
+        :param keep_partial: Keep a resumable partial download when the download fails,
+            for callers that retry the video later and remove it once they give up
+        :return: Path to downloaded video or None
+        """
+        source = self.source_for(video_url)
+        video_id = source.video_id(video_url) if source else None
+        if not video_id:
+            logger.warning(f"Invalid video URL: {video_url}")
+            return None
+        
+        # Skip videos fetched by an earlier run, reusing the file if it is still around
+        video_key = source.video_key(video_id)
+        if self.dedup_index is not None:
+            known_path = self.dedup_index.get_download(video_key)
+            if known_path is not None:
+                logger.info(f"Skipping already downloaded video: {video_key}")
+                return known_path if os.path.exists(known_path) else None
+        
+        full_path = os.path.join(self.download_path, f"{source.name}_video_{index}_{video_id}.mp4")
+        part_path = self.part_path(video_url)
+        try:
+            # Look up the media URL through the platform, then fetch the bytes from its CDN
+            media_url = await self.retry_policy.call(source.resolve, self, video_url, video_id, keyword)
+            if media_url is None:
+                logger.warning(f"No video found at: {video_url}")
+                return None
+            
+            await self.retry_policy.call(self.fetch_media, media_url, full_path, source.media_headers, part_path)
+        except Exception as e:
+            logger.error(f"Error downloading video {video_url}: {e}")
+            if not keep_partial:
+                remove_partial(part_path)
+            return None
+        
+        logger.info(f"Successfully downloaded video: {full_path}")
+        if self.dedup_index is not None:
+            self.dedup_index.add_download(video_key, full_path)
+        return full_path
+
+    async def fetch_text(self, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """
+        Fetch a web page with the pooled HTTP client, within the download engine's caps
+        
+        :param url: Page URL
+        :param headers: Extra request headers
+        :return: Page text
+        """
+        async with self.engine.slot(url):
+            async with self._get_session().get(url, headers=headers) as response:
+                response.raise_for_status()
+                return await response.text()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the pooled HTTP session for media downloads, creating it on first use
+        
+        :return: aiohttp session
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_workers * self.max_segments,
+                limit_per_host=self.per_host_limit * self.max_segments
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return self._session
+
+    async def fetch_media(
+        self,
+        media_url: str,
+        full_path: str,
+        headers: Optional[Dict[str, str]] = None,
+        part_path: Optional[str] = None
+    ) -> Tuple[str, int]:
+        """
+        Download a media file to its final path, in parallel byte ranges when possible
+        
+        The bytes go to a .part file next to the final path, which is renamed
+        into place once complete, so readers never see a partial video. When
+        the origin sends validators, an interrupted download keeps its .part
+        file and progress record, and the next attempt continues from there.
+        
+        :param media_url: Direct URL of the media file
+        :param full_path: Final path of the video
+        :param headers: Extra headers sent with every media request
+        :param part_path: File the bytes are fetched into, full_path + '.part' if omitted
+        :return: SHA-256 and size of the file
+        """
+        part_path = part_path or full_path + '.part'
+        async with self.engine.slot(media_url):
+            try:
+                file_hash, file_size = await self._fetch_to_part(media_url, part_path, headers or {})
+            except BaseException:
+                # Without a progress record the partial file cannot be resumed
+                if read_partial_state(part_path) is None:
+                    remove_partial(part_path)
+                raise
+        
+        if file_size == 0:
+            remove_partial(part_path)
+            raise ValueError(f"Empty response from {media_url}")
+        
+        # Move the video into place atomically and record its digest
+        os.replace(part_path, full_path)
+        remove_partial(part_path)
+        write_digest_sidecar(full_path, file_hash, file_size)
+        return file_hash, file_size
+
+    async def _fetch_to_part(self, media_url: str, part_path: str, headers: Dict[str, str]) -> Tuple[str, int]:
+        """
+        Fetch a media file into a .part file, resuming recorded progress
+        
+        A fresh download asks for the whole file as an open-ended range, and
+        files up to segment_threshold, or from origins ignoring Range, are
+        streamed and hashed in one pass. Larger files keep only the first
+        segment of that response, then the remaining segments are fetched
+        concurrently into the preallocated file. Segments are hashed in file
+        order as soon as they join the contiguous prefix, so hashing overlaps
+        the download; the cost is reading back segments that arrived out of
+        order, normally still in the page cache.
+        
+        :param media_url: Direct URL of the media file
+        :param part_path: Destination file
+        :param headers: Extra headers sent with every media request
+        :return: SHA-256 and size of the file
+        """
+        state = read_partial_state(part_path)
+        if state is not None and 'segments' in state:
+            result = await self._fetch_segments(media_url, part_path, state, headers)
+            if result is not None:
+                return result
+            
+            # The file changed on the origin since the segments were fetched
+            logger.info(f"Media changed since the partial download, restarting: {part_path}")
+            remove_partial(part_path)
+            state = None
+        
+        request_headers = dict(headers)
+        offset = 0
+        if state is not None:
+            offset = state['offset']
+            request_headers['Range'] = f"bytes={offset}-"
+            request_headers['If-Range'] = if_range(state)
+        elif self.segment_size:
+            request_headers['Range'] = "bytes=0-"
+        
+        async with self._get_session().get(media_url, headers=request_headers) as response:
+            response.raise_for_status()
+            content_range = parse_content_range(response.headers.get('Content-Range'))
+            validators = response_validators(response)
+            
+            # Continue a single-stream download, or start over if the origin sent the whole file
+            if state is not None:
+                if response.status != 206:
+                    offset = 0
+                elif content_range is None or content_range[0] != offset:
+                    # Writing this range at the recorded offset would corrupt the file
+                    remove_partial(part_path)
+                    raise aiohttp.ClientPayloadError(
+                        f"Expected a range from byte {offset} of {media_url}, got {response.headers.get('Content-Range')}"
+                    )
+                else:
+                    logger.info(f"Resuming download at byte {offset}: {part_path}")
+                return await self._stream_to_part(response, part_path, offset, validators)
+            
+            # Range ignored, segmentation off or a small file, stream the whole body
+            if response.status != 206 or content_range is None or content_range[2] <= self.segment_threshold:
+                if response.status == 206 and (content_range is None or content_range[0] != 0):
+                    raise aiohttp.ClientPayloadError(f"Expected a range from byte 0 of {media_url}")
+                return await self._stream_to_part(response, part_path, 0, validators)
+            
+            # Preallocate the file and keep the first segment of the response, hashing it in flight
+            file_size = content_range[2]
+            if content_range[0] != 0:
+                raise aiohttp.ClientPayloadError(f"Expected a range from byte 0 of {media_url}")
+            first_size = min(self.segment_size, file_size)
+            sha256_hash = hashlib.sha256()
+            written = 0
+            with open(part_path, 'wb') as f:
+                f.truncate(file_size)
+                async for chunk in response.content.iter_chunked(HASH_BUFFER_SIZE):
+                    chunk = chunk[:first_size - written]
+                    f.write(chunk)
+                    sha256_hash.update(chunk)
+                    written += len(chunk)
+                    if written == first_size:
+                        break
+            if written != first_size:
+                raise aiohttp.ClientPayloadError(
+                    f"Short read for the first segment of {media_url}: got {written} bytes"
+                )
+        
+        state = dict(validators, size=file_size, segment_size=self.segment_size, segments=[[0, written - 1]])
+        if if_range(state):
+            write_partial_state(part_path, state)
+        result = await self._fetch_segments(media_url, part_path, state, headers, sha256_hash, written)
+        if result is None:
+            remove_partial(part_path)
+            raise aiohttp.ClientPayloadError(f"Media changed during the download: {media_url}")
+        return result
+
+    async def _stream_to_part(
+        self,
+        response: aiohttp.ClientResponse,
+        part_path: str,
+        offset: int,
+        validators: Dict[str, Optional[str]]
+    ) -> Tuple[str, int]:
+        """
+        Stream a response body into a .part file from the given offset, hashing as bytes arrive
+        
+        Bytes already in the file before the offset are re-hashed first.
+        Progress is checkpointed as the body arrives so a failed stream can
+        be resumed, provided the origin sent validators.
+        
+        :param response: Media response positioned at the offset
+        :param part_path: Destination file
+        :param offset: Bytes of the file already downloaded and verified
+        :param validators: ETag and Last-Modified of the media file
+        :return: SHA-256 and size of the file
+        """
+        if offset:
+            with open(part_path, 'r+b') as f:
+                f.truncate(offset)
+            loop = asyncio.get_running_loop()
+            sha256_hash = await loop.run_in_executor(None, file_sha256, part_path)
+        else:
+            sha256_hash = hashlib.sha256()
+        
+        state = dict(validators, offset=offset)
+        resumable = if_range(state) is not None
+        try:
+            with open(part_path, 'r+b' if offset else 'wb') as f:
+                f.seek(offset)
+                async for chunk in response.content.iter_chunked(HASH_BUFFER_SIZE):
+                    f.write(chunk)
+                    sha256_hash.update(chunk)
+                    offset += len(chunk)
+                    
+                    if resumable and offset - state['offset'] >= PARTIAL_CHECKPOINT_BYTES:
+                        f.flush()
+                        state['offset'] = offset
+                        write_partial_state(part_path, state)
+        except BaseException:
+            # Record everything written so far for the next attempt
+            if resumable:
+                state['offset'] = offset
+                write_partial_state(part_path, state)
+            raise
+        return sha256_hash.hexdigest(), offset
+
+    async def _fetch_segments(
+        self,
+        media_url: str,
+        part_path: str,
+        state: Dict[str, Any],
+        headers: Dict[str, str],
+        sha256_hash: Optional['hashlib._Hash'] = None,
+        hashed_size: int = 0
+    ) -> Optional[Tuple[str, int]]:
+        """
+        Fetch the segments of a preallocated .part file that are still missing
+        
+        Each finished segment that extends the contiguous prefix is hashed
+        right away, while later segments are still downloading.
+        
+        :param media_url: Direct URL of the media file
+        :param part_path: Preallocated destination file
+        :param state: Validators, size and fetched segments of the file
+        :param headers: Extra headers sent with every media request
+        :param sha256_hash: Hash of the first hashed_size bytes, started from scratch if omitted
+        :param hashed_size: Bytes of the file already fed into sha256_hash
+        :return: SHA-256 and size of the file, or None if the file changed on the origin
+        """
+        file_size = state['size']
+        segment_size = state['segment_size']
+        fetched = {start for start, _ in state['segments']}
+        if sha256_hash is None:
+            sha256_hash, hashed_size = hashlib.sha256(), 0
+        
+        loop = asyncio.get_running_loop()
+        hash_lock = asyncio.Lock()
+        
+        async def hash_prefix():
+            nonlocal hashed_size
+            async with hash_lock:
+                segment_ends = {start: end for start, end in state['segments']}
+                while hashed_size in segment_ends:
+                    end = segment_ends[hashed_size]
+                    await loop.run_in_executor(
+                        None, update_sha256_from_file, sha256_hash, part_path, hashed_size, end - hashed_size + 1
+                    )
+                    hashed_size = end + 1
+        
+        async def fetch_and_hash(start: int) -> bool:
+            end = min(start + segment_size, file_size) - 1
+            if not await self._fetch_segment(media_url, part_path, start, end, slots, state, headers):
+                return False
+            await hash_prefix()
+            return True
+        
+        slots = asyncio.Semaphore(self.max_segments)
+        segment_tasks = [
+            asyncio.ensure_future(fetch_and_hash(start))
+            for start in range(0, file_size, segment_size)
+            if start not in fetched
+        ]
+        
+        # Stop the other segments as soon as one fails, so none writes after we return
+        try:
+            results = await asyncio.gather(*segment_tasks)
+        except BaseException:
+            for task in segment_tasks:
+                task.cancel()
+            raise
+        if not all(results):
+            return None
+        
+        # Segments fetched by an earlier attempt may still be left to hash
+        await hash_prefix()
+        if hashed_size != file_size:
+            raise aiohttp.ClientPayloadError(f"Segments of {media_url} do not cover the file")
+        return sha256_hash.hexdigest(), file_size
+
+    async def _fetch_segment(
+        self,
+        media_url: str,
+        part_path: str,
+        start: int,
+        end: int,
+        slots: asyncio.Semaphore,
+        state: Dict[str, Any],
+        headers: Dict[str, str]
+    ) -> bool:
+        """
+        Fetch one byte range of a media file, write it at its offset and record it as fetched
+        
+        :param media_url: Direct URL of the media file
+        :param part_path: Preallocated destination file
+        :param start: First byte of the range
+        :param end: Last byte of the range, inclusive
+        :param slots: Cap on segments of this file fetched at once
+        :param state: Progress record the segment is added to
+        :param headers: Extra headers sent with every media request
+        :return: False if the origin sent the whole file because it changed
         """
-        try:
-            # Extract shortcode from URL
-            shortcode = video_url.split('/')[-2] if '/reel/' in video_url else None
-            
-            if not shortcode:
-                logger.warning(f"Invalid video URL: {video_url}")
-                return None
+        async with slots:
+            request_headers = dict(headers, Range=f"bytes={start}-{end}")
+            if if_range(state):
+                request_headers['If-Range'] = if_range(state)
             
-            # Sanitize filename
-            sanitized_filename = f"instagram_video_{index}_{shortcode}.mp4"
-            full_path = os.path.join(self.download_path, sanitized_filename)
-            
-            # Attempt to download using Instaloader
-            try:
-                # Get post by shortcode
-                post = instaloader.Post.from_shortcode(self.L.context, shortcode)
+            async with self._get_session().get(media_url, headers=request_headers) as response:
+                response.raise_for_status()
+                if response.status == 200 and 'If-Range' in request_headers:
+                    return False
                 
-                # Download the post
-                self.L.download_post(post, target=self.download_path)
+                content_range = parse_content_range(response.headers.get('Content-Range'))
+                if response.status != 206 or content_range is None or content_range[0] != start:
+                    raise aiohttp.ClientPayloadError(
+                        f"Expected bytes {start}-{end} of {media_url}, got status {response.status}"
+                    )
                 
-                # Find the video file
-                for filename in os.listdir(self.download_path):
-                    if filename.endswith('.mp4'):
-                        original_path = os.path.join(self.download_path, filename)
-                        os.rename(original_path, full_path)
-                        break
-            except Exception as download_error:
-                logger.error(f"Instaloader download failed: {download_error}")
-                return None
-            
-            # Verify download
-            if os.path.exists(full_path) and os.path.getsize(full_path) > 0:
-                logger.info(f"Successfully downloaded video: {full_path}")
-                return full_path
-            
-            return None
+                with open(part_path, 'r+b') as f:
+                    f.seek(start)
+                    written = 0
+                    async for chunk in response.content.iter_chunked(HASH_BUFFER_SIZE):
+                        f.write(chunk)
+                        written += len(chunk)
+                
+                if written != end - start + 1:
+                    raise aiohttp.ClientPayloadError(
+                        f"Short read for bytes {start}-{end} of {media_url}: got {written} bytes"
+                    )
         
-        except Exception as e:
-            logger.error(f"Error downloading video {video_url}: {e}")
-            return None
+        state['segments'].append([start, end])
+        if if_range(state):
+            write_partial_state(part_path, state)
+        return True
 
     async def download_videos(self, keyword: str, max_videos: int = 10) -> List[str]:
         """
@@ -171,40 +2309,91 @@ class VideoDownloader:
         :param max_videos: Maximum number of videos to download
         :return: List of downloaded video paths
         """
-        # Find video links
-        video_links = await self.find_video_links(keyword, max_videos)
-        
-        # Download videos concurrently
-        download_tasks = [
-            self.download_video(link, index) 
-            for index, link in enumerate(video_links, 1)
-        ]
-        
-        # Wait for all downloads to complete
-        downloaded_videos = await asyncio.gather(*download_tasks)
+        # Start downloading each link as soon as its results page is parsed
+        download_tasks = []
+        try:
+            async for link in self.iter_video_links(keyword, max_videos):
+                download_tasks.append(
+                    asyncio.ensure_future(self.download_video(link, len(download_tasks) + 1, keyword))
+                )
+            
+            # Wait for all downloads to complete, cancelling the rest on failure
+            downloaded_videos = await asyncio.gather(*download_tasks)
+        except BaseException:
+            self.engine.cancel()
+            for task in download_tasks:
+                task.cancel()
+            raise
         
         # Remove None values (failed downloads)
         downloaded_videos = [v for v in downloaded_videos if v]
         
         return downloaded_videos
     
-    def close(self):
+    def cancel(self):
+        """
+        Cancel all queued and running downloads
         """
-        Close the browser and end WebDriver session
+        self.engine.cancel()
+
+    async def close(self):
+        """
+        Close the search backend and sources, stop download workers and close the HTTP session
         """
-        if self.driver:
-            self.driver.quit()
+        self.engine.shutdown()
+        await self.search_backend.close()
+        for source in self.sources:
+            await source.close()
+        if self._session is not None:
+            await self._session.close()
 
 class VideoUploader:
-    def __init__(self, flic_token: str):
+    def __init__(
+        self,
+        flic_token: str,
+        dedup_index: Optional[DedupIndex] = None,
+        job_store: Optional[JobStore] = None,
+        retry_policies: Optional[Dict[str, RetryPolicy]] = None,
+        max_connections: int = 20,
+        max_connections_per_host: int = 10,
+        connect_timeout: float = 10,
+        request_timeout: float = 600,
+        keepalive_timeout: float = 30,
+        part_size: Optional[int] = None,
+        max_parallel_parts: int = 4
+    ):
         """
-        Initialize VideoUploader with Flic Token
+        Initialize VideoUploader with Flic Token and a pooled HTTP client
         
         :param flic_token: Authentication token for SocialVerse API
+        :param dedup_index: Index of already uploaded content, nothing is skipped if omitted
+        :param job_store: Store recording each upload step so interrupted uploads can resume
+        :param retry_policies: Retry policies for the upload_url, put and create_post steps
+        :param max_connections: Maximum open connections across all hosts
+        :param max_connections_per_host: Maximum open connections to a single host
+        :param connect_timeout: Seconds allowed to establish a connection
+        :param request_timeout: Seconds allowed for a whole request, including the upload body
+        :param keepalive_timeout: Seconds an idle connection is kept for reuse
+        :param part_size: Upload files larger than this in Content-Range parts, single PUT if omitted
+        :param max_parallel_parts: Number of parts uploaded at once in chunked mode
         """
         self.flic_token = flic_token
+        self.dedup_index = dedup_index
+        self.job_store = job_store
+        self.retry_policies = retry_policies or default_retry_policies()
         self.base_url = "https://api.socialverseapp.com"
         
+        # Connection pool settings, the session itself is created inside the event loop
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(total=request_timeout, connect=connect_timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Chunked upload mode for upload endpoints that accept Content-Range parts
+        self.part_size = part_size
+        self.max_parallel_parts = max_parallel_parts
+        
         # Configure logging
         logging.basicConfig(
             level=logging.INFO, 
@@ -212,6 +2401,37 @@ class VideoUploader:
         )
         self.logger = logging.getLogger(__name__)
 
+    async def __aenter__(self) -> 'VideoUploader':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the pooled HTTP session, creating it on first use
+        
+        :return: aiohttp session
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return self._session
+
+    async def _check_response(self, response: aiohttp.ClientResponse):
+        """
+        Log the body of a failed response, then raise for its status
+        
+        :param response: API response
+        """
+        if response.status >= 400:
+            self.logger.error(f"Response content: {await response.text()}")  # Log response content for debugging
+        response.raise_for_status()
+
     def generate_file_hash(self, file_path: str) -> str:
         """
         Generate SHA-256 hash for the file
@@ -219,23 +2439,42 @@ class VideoUploader:
         :param file_path: Path to the video file
         :return: File hash
         """
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        return hash_file(file_path)
+
+    async def get_file_digest(self, file_path: str) -> Tuple[str, int]:
+        """
+        Get the SHA-256 and size of a file, reusing the digest recorded at download time
+        
+        :param file_path: Path to the video file
+        :return: File hash and size in bytes
+        """
+        recorded = read_digest_sidecar(file_path)
+        if recorded is not None:
+            return recorded
+        
+        # Fall back to hashing on a worker thread
+        loop = asyncio.get_running_loop()
+        file_hash = await loop.run_in_executor(None, hash_file, file_path)
+        return file_hash, os.path.getsize(file_path)
 
-    def get_upload_url(self, file_path: str) -> dict:
+    async def get_upload_url(
+        self,
+        file_path: str,
+        file_hash: Optional[str] = None,
+        file_size: Optional[int] = None
+    ) -> dict:
         """
         Get pre-signed upload URL from SocialVerse API
         
         :param file_path: Path to the video file to upload
+        :param file_hash: SHA-256 of the file, computed if omitted
+        :param file_size: Size of the file in bytes, read if omitted
         :return: Dictionary with upload URL and hash
         """
         try:
             # Generate file hash
-            file_hash = self.generate_file_hash(file_path)
-            file_size = os.path.getsize(file_path)  # Get the file size
+            if file_hash is None or file_size is None:
+                file_hash, file_size = await self.get_file_digest(file_path)
             url =f"{self.base_url}/posts/generate-upload-url"
             # Prepare headers
             headers = {
@@ -250,18 +2489,10 @@ class VideoUploader:
             }
             
             # Send request to get upload URL
-            response = requests.get(
-                url, 
-                json=payload,
-                headers=headers, 
-                
-            )
-            
-            # Check response
-            response.raise_for_status()
-            upload_data = response.json()
-            print(response.json())
-
+            async with self._get_session().get(url, json=payload, headers=headers) as response:
+                # Check response
+                await self._check_response(response)
+                upload_data = await response.json()
             
             self.logger.info(f"Upload URL generated for file: {file_path}")
             return {
@@ -269,13 +2500,28 @@ class VideoUploader:
                 "hash": upload_data.get("hash")
             }
         
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             self.logger.error(f"Error getting upload URL: {e}")
-            if e.response:
-                self.logger.error(f"Response content: {e.response.text}")  # Log response content for debugging
             raise
 
-    def upload_video(self, file_path: str, upload_url: str) -> bool:
+    @staticmethod
+    async def _read_file_chunks(file_path: str, chunk_size: int = HASH_BUFFER_SIZE) -> AsyncIterator[bytes]:
+        """
+        Read a file in chunks on a worker thread
+        
+        :param file_path: Path to the file
+        :param chunk_size: Bytes per chunk
+        :return: Async iterator of chunks
+        """
+        loop = asyncio.get_running_loop()
+        with open(file_path, 'rb') as file:
+            while True:
+                chunk = await loop.run_in_executor(None, file.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    async def upload_video(self, file_path: str, upload_url: str) -> bool:
         """
         Upload video to pre-signed URL
         
@@ -284,32 +2530,167 @@ class VideoUploader:
         :return: Boolean indicating upload success
         """
         try:
-            with open(file_path, 'rb') as file:
-                # Upload using PUT request
-                response = requests.put(
-                    upload_url, 
-                    data=file, 
-                    headers={'Content-Type': 'application/octet-stream'}
-                )
-            
-            response.raise_for_status()
-            self.logger.info(f"Successfully uploaded video: {file_path}")
+            await self._put_video(file_path, upload_url)
             return True
         
-        except requests.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error(f"Error uploading video: {e}")
+            return False
+
+    async def _put_video(self, file_path: str, upload_url: str):
+        """
+        Upload video to pre-signed URL, raising if the upload fails
+        
+        HTTP errors are raised as aiohttp.ClientResponseError, so retry
+        policies can tell a rejected upload from a transient failure.
+        
+        :param file_path: Path to the video file
+        :param upload_url: Pre-signed URL for uploading
+        """
+        file_size = os.path.getsize(file_path)
+        if self.part_size and file_size > self.part_size:
+            await self._put_video_chunked(file_path, upload_url, self.part_size)
+            return
+        
+        # Upload using PUT request, streaming the file with a known length
+        headers = {
+            'Content-Type': 'application/octet-stream',
+            'Content-Length': str(file_size)
+        }
+        async with self._get_session().put(
+            upload_url,
+            data=self._read_file_chunks(file_path),
+            headers=headers
+        ) as response:
+            await self._check_response(response)
+        
+        self.logger.info(f"Successfully uploaded video: {file_path}")
+
+    @staticmethod
+    def _read_part(file_path: str, offset: int, length: int) -> bytes:
+        """
+        Read one upload part from a file (blocking)
+        
+        :param file_path: Path to the video file
+        :param offset: Byte offset of the part
+        :param length: Part length in bytes
+        :return: Part bytes
+        """
+        with open(file_path, 'rb') as file:
+            file.seek(offset)
+            return file.read(length)
+
+    @staticmethod
+    def _load_upload_state(state_path: str, upload_url: str, file_size: int, part_size: int) -> Set[int]:
+        """
+        Load the parts confirmed by an earlier attempt at the same upload
+        
+        :param state_path: Resume state file
+        :param upload_url: Upload URL of the current attempt
+        :param file_size: Size of the file in bytes
+        :param part_size: Part size of the current attempt
+        :return: Indexes of confirmed parts
+        """
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return set()
+        
+        # Parts only carry over to the same upload with the same layout
+        if (state.get('upload_url'), state.get('file_size'), state.get('part_size')) != (upload_url, file_size, part_size):
+            return set()
+        return set(state.get('confirmed_parts', []))
+
+    async def upload_video_chunked(self, file_path: str, upload_url: str, part_size: int) -> bool:
+        """
+        Upload video in Content-Range parts, several at once, resuming confirmed parts
+        
+        :param file_path: Path to the video file
+        :param upload_url: Upload URL accepting Content-Range parts
+        :param part_size: Part size in bytes
+        :return: Boolean indicating upload success
+        """
+        try:
+            await self._put_video_chunked(file_path, upload_url, part_size)
+            return True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             self.logger.error(f"Error uploading video: {e}")
-            if e.response:
-                self.logger.error(f"Response content: {e.response.text}")  # Log response content for debugging
             return False
 
-    def create_post(self, file_hash: str, title: str, category_id: int) -> dict:
+    async def _put_video_chunked(self, file_path: str, upload_url: str, part_size: int):
+        """
+        Upload video in Content-Range parts, raising if a part fails
+        
+        Each part is sent as a PUT with a ``Content-Range: bytes start-end/total``
+        header; 2xx and 308 responses confirm the part. Confirmed parts are
+        recorded in ``<file>.upload.json`` so a later attempt at the same URL
+        skips them. The upload endpoint must accept ranged PUTs.
+        
+        :param file_path: Path to the video file
+        :param upload_url: Upload URL accepting Content-Range parts
+        :param part_size: Part size in bytes
+        """
+        file_size = os.path.getsize(file_path)
+        part_count = (file_size + part_size - 1) // part_size
+        state_path = file_path + '.upload.json'
+        confirmed = self._load_upload_state(state_path, upload_url, file_size, part_size)
+        if confirmed:
+            self.logger.info(f"Resuming upload of {file_path}: {len(confirmed)}/{part_count} parts already sent")
+        
+        part_slots = asyncio.Semaphore(self.max_parallel_parts)
+        loop = asyncio.get_running_loop()
+        
+        def save_state():
+            with open(state_path, 'w') as f:
+                json.dump({
+                    'upload_url': upload_url,
+                    'file_size': file_size,
+                    'part_size': part_size,
+                    'confirmed_parts': sorted(confirmed)
+                }, f)
+        
+        async def upload_part(index: int):
+            offset = index * part_size
+            length = min(part_size, file_size - offset)
+            async with part_slots:
+                data = await loop.run_in_executor(None, self._read_part, file_path, offset, length)
+                headers = {
+                    'Content-Type': 'application/octet-stream',
+                    'Content-Range': f"bytes {offset}-{offset + length - 1}/{file_size}"
+                }
+                async with self._get_session().put(upload_url, data=data, headers=headers) as response:
+                    if response.status != 308:
+                        await self._check_response(response)
+            confirmed.add(index)
+            save_state()
+        
+        part_tasks = [
+            asyncio.ensure_future(upload_part(index))
+            for index in range(part_count)
+            if index not in confirmed
+        ]
+        try:
+            await asyncio.gather(*part_tasks)
+        except BaseException:
+            for task in part_tasks:
+                task.cancel()
+            self.logger.warning(f"Upload interrupted: {len(confirmed)}/{part_count} parts confirmed, resumable")
+            raise
+        
+        try:
+            os.remove(state_path)
+        except FileNotFoundError:
+            pass
+        self.logger.info(f"Successfully uploaded video in {part_count} parts: {file_path}")
+
+    async def create_post(self, file_hash: str, title: str, category_id: int) -> dict:
         """
         Create a post on SocialVerse after video upload
         
         :param file_hash: Hash of the uploaded file
         :param title: Title of the post
         :param category_id: Category ID for the post
-        :param is_public: Whether the post is visible in public feed
         :return: Post creation response
         """
         try:
@@ -330,128 +2711,709 @@ class VideoUploader:
             }
             
             # Send post creation request
-            response = requests.post(
-                url, 
-                headers=headers, 
-                json=payload,
-            )
             self.logger.info(f"Creating post with payload: {payload}")
-            # Check response
-            response.raise_for_status()
-            post_data = response.json()
-            
+            async with self._get_session().post(url, json=payload, headers=headers) as response:
+                # Check response
+                await self._check_response(response)
+                post_data = await response.json()
             
             self.logger.info(f"Post created successfully: {post_data.get('id')}")
             return post_data
         
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             self.logger.error(f"Error creating post: {e}")
-            if e.response is not None:
-                self.logger.error(f"Response content: {e.response.text}")  # Log the response content for more details
-        
             raise
 
-    async def upload_video_to_socialverse(self, file_path: str, title: str, category_id: int) -> dict:
+    async def upload_video_to_socialverse(
+        self,
+        file_path: str,
+        title: str,
+        category_id: int,
+        file_hash: Optional[str] = None,
+        file_size: Optional[int] = None,
+        job_id: Optional[str] = None
+    ) -> dict:
         """
         Comprehensive method to upload video and create post
         
+        With a job store and job_id, each finished step is recorded and an
+        interrupted job resumes after its last completed step.
+        
         :param file_path: Path to the video file
         :param title: Title of the post
         :param category_id: Category ID for the post
-        :param is_public: Whether the post is visible in public feed
+        :param file_hash: SHA-256 of the file, looked up or computed if omitted
+        :param file_size: Size of the file in bytes, looked up if omitted
+        :param job_id: Job tracking this video in the job store
         :return: Post creation response
         """
+        job = None
+        if self.job_store is not None and job_id is not None:
+            job = self.job_store.get(job_id)
+        state = job['state'] if job else None
+        
         try:
-            # Get upload URL
-            upload_info = self.get_upload_url(file_path)
+            if state == 'posted':
+                return {"id": job['post_id'], "duplicate": True}
+            
+            # Skip content that was already posted
+            if file_hash is None or file_size is None:
+                file_hash, file_size = await self.get_file_digest(file_path)
+            if self.dedup_index is not None:
+                known_post = self.dedup_index.get_upload(file_hash)
+                if known_post is not None:
+                    self.logger.info(f"Skipping already uploaded video: {file_path}")
+                    if job:
+                        self.job_store.update(job_id, 'posted', post_id=known_post.get('id'))
+                    return known_post
             
-            # Upload video
-            upload_success = self.upload_video(file_path, upload_info['upload_url'])
+            if state in ('upload_url', 'uploaded'):
+                # Reuse the upload URL from the interrupted attempt
+                upload_info = {"upload_url": job['upload_url'], "hash": job['remote_hash']}
+            else:
+                # Get upload URL
+                upload_info = await self.retry_policies['upload_url'].call(
+                    self.get_upload_url,
+                    file_path,
+                    file_hash,
+                    file_size
+                )
+                if job:
+                    self.job_store.update(
+                        job_id,
+                        'upload_url',
+                        upload_url=upload_info['upload_url'],
+                        remote_hash=upload_info['hash']
+                    )
             
-            if not upload_success:
-                raise ValueError("Video upload failed")
+            if state != 'uploaded':
+                # Upload video
+                try:
+                    await self.retry_policies['put'].call(
+                        self._put_video,
+                        file_path,
+                        upload_info['upload_url']
+                    )
+                except Exception:
+                    # The upload URL may have expired, request a fresh one on the next attempt
+                    if job:
+                        self.job_store.update(job_id, 'hashed', upload_url=None, remote_hash=None)
+                    raise
+                if job:
+                    self.job_store.update(job_id, 'uploaded')
+            else:
+                self.logger.info(f"Video already uploaded, creating post: {file_path}")
             
             # Create post
-            post_data = self.create_post(
+            post_data = await self.retry_policies['create_post'].call(
+                self.create_post,
                 upload_info['hash'], 
                 title, 
-                category_id, 
-                
+                category_id
             )
             
+            if job:
+                self.job_store.update(job_id, 'posted', post_id=post_data.get('id'), error=None)
+            if self.dedup_index is not None:
+                self.dedup_index.add_upload(file_hash, post_data.get('id'))
+            
             return post_data
         
         except Exception as e:
             self.logger.error(f"Complete upload process failed: {e}")
-            if e.response is not None:
-                self.logger.error(f"Response content: {e.response.text}")  # Log the response content for more details
-        
+            if job:
+                self.job_store.record_failure(job_id, str(e))
             raise 
 
-async def main():
-    SOCIAL_MEDIA = 'instagram.com'
-    SEARCH_KEYWORD = input("Enter keyword: ")
-    MAX_VIDEOS = 5  # Number of videos to download
+    async def upload_and_report(
+        self,
+        file_path: str,
+        title: str,
+        category_id: int,
+        delete_after_upload: bool = True,
+        file_hash: Optional[str] = None,
+        file_size: Optional[int] = None,
+        job_id: Optional[str] = None
+    ) -> dict:
+        """
+        Upload one video and report the outcome instead of raising
+        
+        :param file_path: Path to the video file
+        :param title: Title of the post
+        :param category_id: Category ID for the post
+        :param delete_after_upload: Delete the local file once its post is created
+        :param file_hash: SHA-256 of the file, looked up or computed if omitted
+        :param file_size: Size of the file in bytes, looked up if omitted
+        :param job_id: Job tracking this video in the job store
+        :return: Result with file_path, success, post and error keys
+        """
+        try:
+            post_data = await self.upload_video_to_socialverse(
+                file_path,
+                title,
+                category_id,
+                file_hash=file_hash,
+                file_size=file_size,
+                job_id=job_id
+            )
+        except Exception as e:
+            self.logger.error(f"Upload failed for {file_path}: {e}")
+            return {"file_path": file_path, "success": False, "post": None, "error": str(e)}
+        
+        if delete_after_upload and os.path.exists(file_path):
+            remove_video(file_path)
+        self.logger.info(f"Uploaded {file_path}, post ID: {post_data.get('id')}")
+        return {"file_path": file_path, "success": True, "post": post_data, "error": None}
+
+    async def close(self):
+        """
+        Close the pooled HTTP session
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+class VideoPipeline:
+    def __init__(
+        self,
+        downloader: VideoDownloader,
+        uploader: VideoUploader,
+        category_id: int,
+        title_template: str = "{label}: {keyword}",
+        queue_size: int = 10,
+        max_pending_files: int = 10,
+        hash_workers: int = 2,
+        max_concurrent_uploads: int = 4,
+        job_store: Optional[JobStore] = None,
+        search_workers: int = 1
+    ):
+        """
+        Streaming search -> download -> hash -> upload pipeline
+        
+        Stages are connected by bounded queues, and at most max_pending_files
+        videos are on disk at once, so a slow upload stage throttles downloads.
+        
+        :param downloader: Downloader used for the search and download stages
+        :param uploader: Uploader used for the upload stage
+        :param category_id: Category ID for the posts
+        :param title_template: Post title, formatted with the search keyword and the source's label
+        :param queue_size: Capacity of each queue between stages
+        :param max_pending_files: Maximum downloaded videos not yet uploaded
+        :param hash_workers: Number of concurrent hashing workers
+        :param max_concurrent_uploads: Number of uploads in flight at once
+        :param job_store: Durable per-video state, used to resume after a crash
+        :param search_workers: Number of keywords searched at once in batch runs
+        """
+        self.downloader = downloader
+        self.uploader = uploader
+        self.category_id = category_id
+        self.title_template = title_template
+        self.queue_size = queue_size
+        self.max_pending_files = max_pending_files
+        self.download_workers = downloader.engine.max_workers
+        self.hash_workers = hash_workers
+        self.upload_workers = max_concurrent_uploads
+        self.job_store = job_store
+        self.search_workers = search_workers
+
+    @staticmethod
+    async def _run_stage(workers: List[Any], out_queue: Optional[asyncio.Queue], next_workers: int):
+        """
+        Wait for a stage's workers, then tell every worker of the next stage to stop
+        
+        :param workers: Worker coroutines of the stage
+        :param out_queue: Queue feeding the next stage
+        :param next_workers: Number of workers reading from out_queue
+        """
+        await asyncio.gather(*workers)
+        if out_queue is not None:
+            for _ in range(next_workers):
+                await out_queue.put(None)
+
+    async def _resume_jobs(
+        self,
+        links: asyncio.Queue,
+        downloaded: asyncio.Queue,
+        hashed: asyncio.Queue,
+        disk_slots: asyncio.Semaphore
+    ) -> int:
+        """
+        Feed jobs interrupted by an earlier run back in after their last completed step
+        
+        :param links: Download stage queue
+        :param downloaded: Hash stage queue
+        :param hashed: Upload stage queue
+        :param disk_slots: Semaphore bounding files on disk
+        :return: Number of resumed jobs
+        """
+        jobs = self.job_store.unfinished()
+        for index, row in enumerate(jobs, 1):
+            job = {
+                "job_id": row['job_id'],
+                "keyword": row['keyword'],
+                "url": row['url'],
+                "index": index,
+                "file_path": row['file_path'],
+                "file_hash": row['file_hash'],
+                "file_size": row['file_size']
+            }
+            
+            # Files that vanished since the crash are downloaded again, unless only the post is missing
+            state = row['state']
+            file_missing = not (row['file_path'] and os.path.exists(row['file_path']))
+            if state not in ('searched', 'uploaded') and file_missing:
+                self.job_store.update(row['job_id'], 'searched', file_path=None, file_hash=None, file_size=None)
+                if self.downloader.dedup_index is not None:
+                    self.downloader.dedup_index.remove_download(row['job_id'])
+                state = 'searched'
+            
+            if state == 'searched':
+                await links.put(job)
+            elif state == 'downloaded':
+                await disk_slots.acquire()
+                await downloaded.put(job)
+            else:
+                await disk_slots.acquire()
+                await hashed.put(job)
+        
+        if jobs:
+            logger.info(f"Resuming {len(jobs)} unfinished jobs")
+        return len(jobs)
+
+    async def run(self, keyword: str, max_videos: int = 10, resume: bool = True) -> List[dict]:
+        """
+        Search, download and upload videos for a keyword, streaming between stages
+        
+        :param keyword: Search keyword
+        :param max_videos: Maximum number of new videos to process
+        :param resume: Also finish jobs interrupted by an earlier run (requires a job store)
+        :return: Per-file upload results with file_path, success, post and error keys
+        """
+        return await self.run_batch([keyword], max_videos, resume)
+
+    async def run_batch(self, keywords: Iterable[str], max_videos: int = 10, resume: bool = True) -> List[dict]:
+        """
+        Search, download and upload videos for many keywords in one stream
+        
+        Keywords are searched search_workers at a time. A video found by several
+        keywords is only downloaded once, under the first keyword that found it.
+        
+        :param keywords: Search keywords, consumed lazily so long lists are fine
+        :param max_videos: Maximum number of videos searched per keyword
+        :param resume: Also finish jobs interrupted by an earlier run (requires a job store)
+        :return: Per-file upload results with file_path, success, post and error keys
+        """
+        links: asyncio.Queue = asyncio.Queue(self.queue_size)
+        downloaded: asyncio.Queue = asyncio.Queue(self.queue_size)
+        hashed: asyncio.Queue = asyncio.Queue(self.queue_size)
+        disk_slots = asyncio.Semaphore(self.max_pending_files)
+        results: List[dict] = []
+        
+        pending_keywords = iter(keywords)
+        seen_jobs: Set[str] = set()
+        
+        async def search_worker(indexes: Iterator[int]):
+            for keyword in pending_keywords:
+                async for link in self.downloader.iter_video_links(keyword, max_videos):
+                    job_id = self.downloader.video_key(link) or link
+                    
+                    # The same reel often turns up for several keywords
+                    if job_id in seen_jobs:
+                        continue
+                    seen_jobs.add(job_id)
+                    
+                    # Videos that already have a job were resumed or are finished
+                    if self.job_store is not None and not self.job_store.add(job_id, keyword, link):
+                        continue
+                    
+                    await links.put({"job_id": job_id, "keyword": keyword, "url": link, "index": next(indexes)})
+        
+        async def search_stage():
+            resumed = 0
+            if resume and self.job_store is not None:
+                resumed = await self._resume_jobs(links, downloaded, hashed, disk_slots)
+            
+            indexes = itertools.count(resumed + 1)
+            await asyncio.gather(*(search_worker(indexes) for _ in range(self.search_workers)))
+        
+        async def download_worker():
+            while True:
+                job = await links.get()
+                if job is None:
+                    break
+                
+                # Wait for disk space before fetching another video
+                await disk_slots.acquire()
+                file_path = await self.downloader.download_video(
+                    job['url'],
+                    job['index'],
+                    job['keyword'],
+                    keep_partial=self.job_store is not None
+                )
+                if file_path:
+                    if self.job_store is not None:
+                        self.job_store.update(job['job_id'], 'downloaded', file_path=file_path)
+                    job['file_path'] = file_path
+                    await downloaded.put(job)
+                else:
+                    # A partial download is kept for the job's next attempt, unless this was its last
+                    if self.job_store is not None and self.job_store.record_failure(job['job_id'], "Download failed"):
+                        part_path = self.downloader.part_path(job['url'])
+                        if part_path is not None:
+                            remove_partial(part_path)
+                    disk_slots.release()
+        
+        async def hash_worker():
+            while True:
+                job = await downloaded.get()
+                if job is None:
+                    break
+                file_path = job['file_path']
+                try:
+                    file_hash, file_size = await self.uploader.get_file_digest(file_path)
+                except OSError as e:
+                    logger.error(f"Hashing failed for {file_path}: {e}")
+                    if self.job_store is not None:
+                        self.job_store.record_failure(job['job_id'], str(e))
+                    results.append({"file_path": file_path, "success": False, "post": None, "error": str(e)})
+                    disk_slots.release()
+                    continue
+                if self.job_store is not None:
+                    self.job_store.update(job['job_id'], 'hashed', file_hash=file_hash, file_size=file_size)
+                job.update(file_hash=file_hash, file_size=file_size)
+                await hashed.put(job)
+        
+        async def upload_worker():
+            while True:
+                job = await hashed.get()
+                if job is None:
+                    break
+                source = self.downloader.source_for(job['url'])
+                title = self.title_template.format(keyword=job['keyword'], label=source.label if source else '')
+                try:
+                    results.append(await self.uploader.upload_and_report(
+                        job['file_path'],
+                        title,
+                        self.category_id,
+                        file_hash=job['file_hash'],
+                        file_size=job['file_size'],
+                        job_id=job['job_id']
+                    ))
+                finally:
+                    disk_slots.release()
+        
+        stages = [
+            self._run_stage([search_stage()], links, self.download_workers),
+            self._run_stage(
+                [download_worker() for _ in range(self.download_workers)],
+                downloaded,
+                self.hash_workers
+            ),
+            self._run_stage(
+                [hash_worker() for _ in range(self.hash_workers)],
+                hashed,
+                self.upload_workers
+            ),
+            self._run_stage([upload_worker() for _ in range(self.upload_workers)], None, 0)
+        ]
+        tasks = [asyncio.ensure_future(stage) for stage in stages]
+        
+        # Tear the whole pipeline down if any stage fails
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            self.downloader.cancel()
+            raise
+        
+        succeeded = sum(1 for result in results if result["success"])
+        logger.info(f"Pipeline finished: {succeeded}/{len(results)} videos uploaded")
+        return results
+
+class _VideoEventHandler(FileSystemEventHandler):
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        """
+        Forward filesystem events for .mp4 files from the observer thread to the event loop
+        
+        :param loop: Event loop running the watcher
+        :param queue: Queue of (path, fully_written) tuples
+        """
+        self.loop = loop
+        self.queue = queue
+
+    def _enqueue(self, path: str, fully_written: bool):
+        if path.lower().endswith('.mp4'):
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, (path, fully_written))
+
+    def on_created(self, event: FileSystemEvent):
+        if not event.is_directory:
+            self._enqueue(event.src_path, False)
+
+    def on_closed(self, event: FileSystemEvent):
+        # inotify IN_CLOSE_WRITE: the writer has closed the file
+        if not event.is_directory:
+            self._enqueue(event.src_path, True)
+
+    def on_moved(self, event: FileSystemEvent):
+        # Files renamed into place are complete
+        if not event.is_directory:
+            self._enqueue(event.dest_path, True)
+
+class DirectoryWatcher:
+    def __init__(
+        self,
+        uploader: VideoUploader,
+        watch_path: str,
+        category_id: int,
+        title_template: str = "{name}",
+        max_concurrent_uploads: int = 4,
+        settle_time: float = 2.0
+    ):
+        """
+        Watch a directory for new .mp4 files and upload each one once fully written
+        
+        :param uploader: Uploader used for every new file
+        :param watch_path: Directory to watch
+        :param category_id: Category ID for the posts
+        :param title_template: Post title, formatted with the file name without extension
+        :param max_concurrent_uploads: Number of uploads in flight at once
+        :param settle_time: Seconds a file's size must stay unchanged when no close event is available
+        """
+        self.uploader = uploader
+        self.watch_path = watch_path
+        self.category_id = category_id
+        self.title_template = title_template
+        self.max_concurrent_uploads = max_concurrent_uploads
+        self.settle_time = settle_time
+        self._pending: Set[str] = set()
+
+    async def _wait_until_written(self, file_path: str) -> bool:
+        """
+        Wait until a file stops growing
+        
+        :param file_path: Path to the video file
+        :return: False if the file disappeared
+        """
+        last_size = -1
+        while True:
+            try:
+                size = os.path.getsize(file_path)
+            except OSError:
+                return False
+            if size == last_size and size > 0:
+                return True
+            last_size = size
+            await asyncio.sleep(self.settle_time)
+
+    async def _settle(self, file_path: str, ready: asyncio.Queue):
+        """
+        Queue a file for upload once it stops growing
+        
+        :param file_path: Path to the video file
+        :param ready: Queue of files ready for upload
+        """
+        if await self._wait_until_written(file_path):
+            await ready.put(file_path)
+        else:
+            self._pending.discard(file_path)
+
+    async def _dispatch(self, events: asyncio.Queue, ready: asyncio.Queue):
+        """
+        Turn filesystem events into upload jobs, once per file
+        
+        :param events: Queue of (path, fully_written) tuples
+        :param ready: Queue of files ready for upload
+        """
+        settling: Dict[str, asyncio.Task] = {}
+        while True:
+            file_path, fully_written = await events.get()
+            
+            if fully_written:
+                # A close or move event beats any size polling already running
+                task = settling.pop(file_path, None)
+                if task is not None and not task.done():
+                    task.cancel()
+                elif file_path in self._pending:
+                    continue
+                self._pending.add(file_path)
+                await ready.put(file_path)
+            elif file_path not in self._pending:
+                self._pending.add(file_path)
+                task = asyncio.ensure_future(self._settle(file_path, ready))
+                settling[file_path] = task
+                task.add_done_callback(lambda _, path=file_path: settling.pop(path, None))
+
+    async def _upload_worker(self, ready: asyncio.Queue):
+        """
+        Upload files that are fully written
+        
+        :param ready: Queue of files ready for upload
+        """
+        while True:
+            file_path = await ready.get()
+            try:
+                if not os.path.exists(file_path):
+                    continue
+                
+                name = os.path.splitext(os.path.basename(file_path))[0]
+                await self.uploader.upload_and_report(
+                    file_path,
+                    self.title_template.format(name=name),
+                    self.category_id
+                )
+            finally:
+                self._pending.discard(file_path)
+
+    async def run(self):
+        """
+        Upload files already in the directory, then watch it until cancelled
+        """
+        os.makedirs(self.watch_path, exist_ok=True)
+        events: asyncio.Queue = asyncio.Queue()
+        ready: asyncio.Queue = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+        
+        # Start watching before the initial scan so no file slips in between
+        observer = Observer()
+        observer.schedule(_VideoEventHandler(loop, events), self.watch_path, recursive=False)
+        observer.start()
+        logger.info(f"Watching {self.watch_path} for new .mp4 files")
+        
+        with os.scandir(self.watch_path) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith('.mp4'):
+                    events.put_nowait((entry.path, False))
+        
+        workers = [asyncio.ensure_future(self._dispatch(events, ready))] + [
+            asyncio.ensure_future(self._upload_worker(ready))
+            for _ in range(self.max_concurrent_uploads)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            observer.stop()
+            await loop.run_in_executor(None, observer.join)
+
+def read_keywords(file_path: str) -> List[str]:
+    """
+    Read search keywords from a text file, one per line
+    
+    Blank lines, lines starting with # and repeated keywords are skipped.
+    
+    :param file_path: Path to the keywords file
+    :return: Keywords in file order
+    """
+    with open(file_path, encoding='utf-8') as f:
+        lines = (line.strip() for line in f)
+        return list(dict.fromkeys(line for line in lines if line and not line.startswith('#')))
+
+async def main(keywords: Optional[List[str]] = None):
+    SOCIAL_MEDIA = 'instagram.com'  # 'instagram.com', 'tiktok.com' or both, comma separated
+    SEARCH_KEYWORDS = keywords or [input("Enter keyword: ")]
+    MAX_VIDEOS = 5  # Number of videos to download per keyword
+    SEARCH_BACKEND = 'selenium'  # 'selenium' or 'http'
+    SEARCH_BROWSERS = 3  # Browsers shared by concurrent keyword searches
+    MAX_CONCURRENT_UPLOADS = 4  # Number of uploads in flight at once
+    
+    # Searches are cached locally so repeated keywords skip Google
+    search_cache = SearchCache()
+    
+    # Shortcodes and content hashes already handled by earlier runs
+    dedup_index = DedupIndex()
+    
+    # Per-video progress, so a crashed run resumes where it stopped
+    job_store = JobStore()
+    
+    # Keywords of a batch are searched concurrently, sharing one pool of browsers
+    search_workers = min(SEARCH_BROWSERS, len(SEARCH_KEYWORDS))
+    browser_pool = BrowserPool(size=search_workers)
+    if SEARCH_BACKEND == 'http':
+        search_backend = HttpSearchBackend()
+    else:
+        search_backend = SeleniumSearchBackend(browser_pool)
     
     # Create downloader instance
     downloader = VideoDownloader(
         SOCIAL_MEDIA,
-        download_path='instagram_videos'
+        download_path='instagram_videos',
+        search_backend=search_backend,
+        search_cache=search_cache,
+        dedup_index=dedup_index
     )
     
-    downloaded_files = []  # Initialize an empty list to store downloaded files
+    uploader = VideoUploader(flic_token=FLIC_TOKEN, dedup_index=dedup_index, job_store=job_store)
+    
+    # Videos are uploaded while later ones are still downloading
+    pipeline = VideoPipeline(
+        downloader,
+        uploader,
+        category_id=25,  # Replace with actual category IDcake
+        max_concurrent_uploads=MAX_CONCURRENT_UPLOADS,
+        job_store=job_store,
+        search_workers=search_workers
+    )
+    
+    upload_results = []  # Initialize an empty list to store per-file upload results
     
     try:
-        # Add retry mechanism
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                downloaded_files = await downloader.download_videos(
-                    SEARCH_KEYWORD, 
-                    MAX_VIDEOS
-                )
-                
-                if downloaded_files:
-                    logger.info("\nDownloaded Videos:")
-                    for video in downloaded_files:
-                        logger.info(video)
-                    break
-                else:
-                    logger.warning(f"No videos downloaded on attempt {attempt + 1}")
-            
-            except Exception as retry_error:
-                logger.error(f"Retry attempt {attempt + 1} failed: {retry_error}")
-                await asyncio.sleep(3)
+        # Each search, fetch and upload step retries on its own
+        upload_results = await pipeline.run_batch(SEARCH_KEYWORDS, MAX_VIDEOS)
     
     except Exception as e:
         logger.error(f"An error occurred: {e}")
     
     finally:
-        # Always close the browser
-        downloader.close()
-
-    # Ensure that downloaded_files is not empty before proceeding to upload
-    if downloaded_files:
-        uploader = VideoUploader(flic_token="flic_16a53d750040604a11c71ae66b138ee44b85929c51fa21abe26db4167627552b"
-)
-        
-        try:
-            # Upload each downloaded video
-            for video_path in downloaded_files:
-                # Upload each downloaded video
-                post_response = await uploader.upload_video_to_socialverse(
-                    file_path=video_path,
-                    title=f"Instagram Reel: {SEARCH_KEYWORD}",
-                    category_id=25,  # Replace with actual category IDcake
-                )
-                os.remove(video_path) 
-                print(f"Video uploaded. Post ID: {post_response.get('id')}")
-        
-        except Exception as e:
-            logger.error(f"Upload failed: {e}")
-    else:
+        # Always close the browser and the HTTP connections
+        await downloader.close()
+        await uploader.close()
+        browser_pool.close()
+        search_cache.close()
+        dedup_index.close()
+        job_store.close()
+    
+    for result in upload_results:
+        if result['success']:
+            print(f"Video uploaded. Post ID: {result['post'].get('id')}")
+        else:
+            print(f"Upload failed for {result['file_path']}: {result['error']}")
+    
+    if not upload_results:
         logger.warning("No videos were downloaded, skipping upload.")
 
+async def watch_main(watch_path: str):
+    MAX_CONCURRENT_UPLOADS = 4  # Number of uploads in flight at once
+    
+    dedup_index = DedupIndex()
+    uploader = VideoUploader(flic_token=FLIC_TOKEN, dedup_index=dedup_index)
+    watcher = DirectoryWatcher(
+        uploader,
+        watch_path,
+        category_id=25,  # Replace with actual category ID
+        max_concurrent_uploads=MAX_CONCURRENT_UPLOADS
+    )
+    
+    try:
+        await watcher.run()
+    finally:
+        await uploader.close()
+        dedup_index.close()
+
 # Run the async main functionj
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Download Instagram Reels and upload them to SocialVerse")
+    parser.add_argument('--watch', metavar='DIR', help="Watch DIR (e.g. /videos) and upload new .mp4 files")
+    parser.add_argument('--keywords-file', metavar='FILE', help="Search every keyword in FILE, one per line")
+    parser.add_argument('--keyword', action='append', default=[], help="Keyword to search, may be repeated")
+    args = parser.parse_args()
+    
+    keywords = list(args.keyword)
+    if args.keywords_file:
+        keywords = list(dict.fromkeys(keywords + read_keywords(args.keywords_file)))
+    
+    try:
+        asyncio.run(watch_main(args.watch) if args.watch else main(keywords))
+    except KeyboardInterrupt:
+        pass
\ No newline at end of file
@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+
+from main import VideoUploader
+from upload_standin import UploadStandIn
+
+PART_SIZE = 64 * 1024
+
+
+class ChunkedUploadTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmp_dir.name, 'video.mp4')
+        self.data = os.urandom(PART_SIZE * 2 + PART_SIZE // 2)
+        with open(self.file_path, 'wb') as f:
+            f.write(self.data)
+
+        # The second part fails once, the third is never reached on the first attempt
+        self.server = UploadStandIn(fail_once=[PART_SIZE])
+        self.upload_url = await self.server.start()
+        self.uploader = VideoUploader('test-token', part_size=PART_SIZE, max_parallel_parts=1)
+
+    async def asyncTearDown(self):
+        await self.uploader.close()
+        await self.server.stop()
+        self.tmp_dir.cleanup()
+
+    async def test_failed_part_then_resume(self):
+        state_path = self.file_path + '.upload.json'
+
+        first = await self.uploader.upload_video(self.file_path, self.upload_url)
+        self.assertFalse(first)
+        self.assertTrue(os.path.exists(state_path))
+        self.assertFalse(self.server.complete())
+
+        sent_before_resume = len(self.server.requests)
+        second = await self.uploader.upload_video(self.file_path, self.upload_url)
+        self.assertTrue(second)
+
+        # Only the unconfirmed parts are sent again
+        resumed = [start for start, _ in self.server.requests[sent_before_resume:]]
+        self.assertEqual(resumed, [PART_SIZE, PART_SIZE * 2])
+        self.assertEqual(self.server.assembled(), self.data)
+        self.assertFalse(os.path.exists(state_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Local stand-in for an upload endpoint that accepts ranged PUTs
+
+Used to exercise VideoUploader's chunked upload mode without SocialVerse.
+Run it directly to serve http://127.0.0.1:8080/upload:
+
+    python upload_standin.py
+"""
+import socket
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from aiohttp import web
+
+
+class UploadStandIn:
+    def __init__(self, fail_once: Iterable[int] = ()):
+        """
+        Upload endpoint storing the parts it receives in memory
+
+        Parts are PUT with a ``Content-Range: bytes start-end/total`` header.
+        Incomplete uploads are answered with 308, the part completing the file
+        with 200.
+
+        :param fail_once: Start offsets whose first PUT is answered with a 500
+        """
+        self.fail_once = set(fail_once)
+        self.parts: Dict[int, bytes] = {}
+        self.total_size: Optional[int] = None
+        self.requests: List[Tuple[int, int]] = []
+        self._runner: Optional[web.AppRunner] = None
+
+    def assembled(self) -> bytes:
+        """
+        Join the received parts in offset order
+
+        :return: Uploaded bytes
+        """
+        return b''.join(self.parts[offset] for offset in sorted(self.parts))
+
+    def complete(self) -> bool:
+        """
+        Check whether every byte of the upload has been received
+
+        :return: True once the parts cover the whole file
+        """
+        return self.total_size is not None and len(self.assembled()) == self.total_size
+
+    async def handle_put(self, request: web.Request) -> web.Response:
+        """
+        Store one uploaded part
+
+        :param request: PUT request carrying a Content-Range header
+        :return: 308 while parts are missing, 200 once the upload is complete
+        """
+        try:
+            byte_range, total = request.headers['Content-Range'][len('bytes '):].split('/')
+            start, end = (int(value) for value in byte_range.split('-'))
+        except (KeyError, ValueError):
+            return web.Response(status=400, text="Missing or invalid Content-Range")
+
+        self.requests.append((start, end))
+        data = await request.read()
+        if start in self.fail_once:
+            self.fail_once.discard(start)
+            return web.Response(status=500, text="Injected failure")
+        if len(data) != end - start + 1:
+            return web.Response(status=400, text="Body does not match Content-Range")
+
+        self.total_size = int(total)
+        self.parts[start] = data
+        return web.Response(status=200 if self.complete() else 308)
+
+    def app(self) -> web.Application:
+        """
+        Build the aiohttp application serving PUT /upload
+
+        :return: aiohttp application
+        """
+        app = web.Application(client_max_size=1024 ** 3)
+        app.router.add_put('/upload', self.handle_put)
+        return app
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """
+        Start serving in the running event loop
+
+        :param host: Interface to bind
+        :param port: Port to bind, any free port if 0
+        :return: Upload URL
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind((host, port))
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+        await web.SockSite(self._runner, sock).start()
+        return f"http://{host}:{sock.getsockname()[1]}/upload"
+
+    async def stop(self):
+        """
+        Stop serving
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+if __name__ == "__main__":
+    web.run_app(UploadStandIn().app(), host='127.0.0.1', port=8080)